@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import math
+import selectors
+import _tkinter
+import tkinter as tk
+from tkinter import ttk
+from tkinter.constants import *
+from simpletable import SimpleTable
+
+__doc__ = """
+Asyncio event loop which handles the tk events while it waits, tk and asyncio share one thread
+"""
+
+POLL_INTERVAL = 10  # milliseconds between checks of files tk can not watch
+MAX_EVENTS = 100  # pending tk events handled per iteration of the asyncio loop
+
+
+class TkSelector(selectors.DefaultSelector):
+    """
+    Selector which waits in the tcl event loop, tk events, asyncio files and the timeout wake it up
+    Files are watched by tcl file handlers, without them (windows) the files are polled
+    """
+
+    def __init__(self, root):
+        selectors.DefaultSelector.__init__(self)
+        self.root = root
+
+    def select(self, timeout=None):
+        if timeout is None or timeout > 0:
+            self._wait(timeout)
+
+        for _ in range(MAX_EVENTS):  # tk events which came in meanwhile
+            if not self.root.tk.dooneevent(_tkinter.DONT_WAIT):
+                break
+        return selectors.DefaultSelector.select(self, 0)
+
+    def _wait(self, timeout):
+        """
+        Handles tk events until one arrives for asyncio or the timeout passed
+        """
+
+        if selectors.DefaultSelector.select(self, 0):
+            return
+
+        tk_app = self.root.tk
+        watch_files = hasattr(tk_app, "createfilehandler")
+
+        files = []
+        if watch_files:
+            for key in self.get_map().values():
+                mask = 0
+                if key.events & selectors.EVENT_READ:
+                    mask |= tk.READABLE
+                if key.events & selectors.EVENT_WRITE:
+                    mask |= tk.WRITABLE
+                tk_app.createfilehandler(key.fd, mask, lambda fd, mask: None)
+                files.append(key.fd)
+
+        milliseconds = None
+        if not timeout is None:
+            milliseconds = math.ceil(timeout * 1000)
+        if not watch_files:
+            milliseconds = min(milliseconds or POLL_INTERVAL, POLL_INTERVAL)
+
+        timer = None
+        if not milliseconds is None:
+            timer = self.root.after(milliseconds, lambda: None)
+        try:
+            tk_app.dooneevent(0)  # blocks in tcl until something happens
+        finally:
+            if not timer is None:
+                self.root.after_cancel(timer)
+            for fd in files:
+                tk_app.deletefilehandler(fd)
+
+
+class TkEventLoop(asyncio.SelectorEventLoop):
+    """
+    Asyncio event loop handling the events of the tk root while it waits, no busy waiting
+    """
+
+    def __init__(self, root):
+        asyncio.SelectorEventLoop.__init__(self, TkSelector(root))
+        self.root = root
+
+
+def run(main, root):
+    """
+    Runs coroutine main in a tk event loop of root instead of mainloop, returns the result of main
+    """
+
+    loop = TkEventLoop(root)
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def wait_closed(window):
+    """
+    Returns once window got destroyed, like mainloop does for the root
+    """
+
+    future = asyncio.get_running_loop().create_future()
+
+    def _on_destroy(event):
+        if event.widget is window and not future.done():
+            future.set_result(None)
+
+    window.bind("<Destroy>", _on_destroy, add=True)
+    await future
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate loading a table from an async source
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.table = SimpleTable(self)
+            self.table.set_title(["row", "square"])
+            self.table.pack()
+
+            self.label = ttk.Label(self, text="loading")
+            self.label.pack()
+
+        async def load(self):
+            async def _rows():
+                for row in range(5000):
+                    if row % 100 == 0:
+                        await asyncio.sleep(0.1)  # data arrives slowly
+                    yield [f"{row}", f"{row * row}"]
+
+            added = await self.table.set_data_async(_rows())
+            self.label.configure(text=f"{added} rows loaded")
+
+        async def main(self):
+            asyncio.create_task(self.load())
+            await wait_closed(self)
+
+    app = SampleApp()
+    run(app.main(), app)
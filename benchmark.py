@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from time import perf_counter
+import tkinter as tk
+from table import (
+    POOL_SIZE,
+    Table,
+    get_readonly_row_generator,
+    get_input_row_generator_centered,
+)
+
+__doc__ = """
+Benchmarks for the table widgets, run this file with a display available
+"""
+
+
+def benchmark_structural_edits(
+    root, number_of_rows: int = 5000, columns: int = 5, repeat: int = 50
+):
+    """
+    Measures insert_row and remove_row at the start, middle and end of a table
+    Returns list of (position name, row, milliseconds per insert and remove)
+    """
+
+    row_generator = get_readonly_row_generator(columns)
+
+    table = Table(root)
+    table.pack()
+    table.add_rows(number_of_rows, row_generator)
+    root.update()
+
+    results = []
+    for name, row in (
+        ("first", 0),
+        ("middle", number_of_rows // 2),
+        ("last", number_of_rows - 1),
+    ):
+        start = perf_counter()
+        for _ in range(repeat):
+            table.insert_row(row, row_generator)
+            table.remove_row(row)
+        root.update_idletasks()  # include the relayout done by tk
+        results.append((name, row, (perf_counter() - start) * 1000 / repeat))
+
+    table.destroy()
+    return results
+
+
+def benchmark_row_churn(
+    root, number_of_rows: int = 500, columns: int = 5, repeat: int = 200
+):
+    """
+    Measures removing the first row and adding a row at the end, without and with the widget pool
+    Returns (milliseconds per row without pool, milliseconds per row with pool, pool hits, pool misses)
+    """
+
+    row_generator = get_readonly_row_generator(columns)
+
+    results = []
+    for pool_size in (0, POOL_SIZE):
+        table = Table(root)
+        table.pool_size = pool_size
+        table.pack()
+        table.add_rows(number_of_rows, row_generator)
+        root.update()
+
+        start = perf_counter()
+        for _ in range(repeat):
+            table.remove_row(0)
+            table.add_row(row_generator)
+        root.update_idletasks()  # include the relayout done by tk
+        results.append((perf_counter() - start) * 1000 / repeat)
+
+        table.destroy()
+    return (*results, table.pool_hits, table.pool_misses)
+
+
+def benchmark_set_data(root, number_of_rows: int = 2000, columns: int = 5):
+    """
+    Measures filling a table row by row with set_row against add_data_rows
+    Returns list of (row kind, rows per second row by row, rows per second bulk)
+    """
+
+    data_rows = [
+        [f"{row} {column}" for column in range(columns)]
+        for row in range(number_of_rows)
+    ]
+
+    results = []
+    for name, row_generator in (
+        ("labels", get_readonly_row_generator(columns)),
+        ("entries", get_input_row_generator_centered(columns)),
+    ):
+        speeds = []
+        for bulk in (False, True):
+            table = Table(root)
+            if not bulk:  # row by row through the generators as before the bulk api
+                table.create_with_script = False
+                table.pool_size = 0
+            table.pack()
+            root.update()
+
+            start = perf_counter()
+            if bulk:
+                table.add_data_rows(data_rows, row_generator)
+            else:
+                for values in data_rows:
+                    table.add_row(row_generator)
+                    table.set_row(table.get_row_count() - 1, values)
+            root.update_idletasks()  # include the layout done by tk
+            speeds.append(number_of_rows / (perf_counter() - start))
+
+            table.destroy()
+        results.append((name, *speeds))
+
+    return results
+
+
+def benchmark_create_cells(root, number_of_rows: int = 2000, columns: int = 5):
+    """
+    Measures creating filled cells through the row generators, widget by widget in python
+    and with one tcl script per batch of rows
+    Returns list of (row kind, cells per second for generators, python and script)
+    """
+
+    data_rows = [
+        [f"{row} {column}" for column in range(columns)]
+        for row in range(number_of_rows)
+    ]
+
+    results = []
+    for name, row_generator in (
+        ("labels", get_readonly_row_generator(columns)),
+        ("entries", get_input_row_generator_centered(columns)),
+    ):
+        speeds = []
+        for backend in ("generators", "python", "script"):
+            table = Table(root)
+            table.create_with_script = backend == "script"
+            table.pack()
+            root.update()
+
+            start = perf_counter()
+            if backend == "generators":
+                for values in data_rows:
+                    table.add_row(row_generator)
+                    table.set_row(table.get_row_count() - 1, values)
+            else:
+                table.add_data_rows(data_rows, row_generator)
+            root.update_idletasks()  # include the layout done by tk
+            speeds.append(number_of_rows * columns / (perf_counter() - start))
+
+            table.destroy()
+        results.append((name, *speeds))
+
+    return results
+
+
+def benchmark_batch(
+    root, number_of_rows: int = 2000, columns: int = 5, idle_every: int = 100
+):
+    """
+    Measures add_row with idle tasks running in between, as during a long load, with and without batch
+    Returns (rows per second unbatched, rows per second batched)
+    """
+
+    row_generator = get_readonly_row_generator(columns)
+
+    speeds = []
+    for batched in (False, True):
+        table = Table(root)
+        table.pack()
+        root.update()
+
+        start = perf_counter()
+        if batched:
+            table.batch()
+        for row in range(number_of_rows):
+            table.add_row(row_generator)
+            if row % idle_every == 0:
+                root.update_idletasks()
+        if batched:
+            table.end_batch()
+        root.update_idletasks()  # include the layout done by tk
+        speeds.append(number_of_rows / (perf_counter() - start))
+
+        table.destroy()
+    return tuple(speeds)
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.withdraw()
+
+    print("insert_row and remove_row by position:")
+    for name, row, milliseconds in benchmark_structural_edits(root):
+        print(f"  {name:>6} (row {row:>5}): {milliseconds:8.3f} ms")
+
+    unpooled, pooled, hits, misses = benchmark_row_churn(root)
+    print("remove first row and add a row, per row:")
+    print(f"  {unpooled:8.3f} ms without pool, {pooled:8.3f} ms with pool")
+    print(f"  pool hits {hits}, misses {misses}")
+
+    print("set data, rows per second:")
+    for name, row_by_row, bulk in benchmark_set_data(root):
+        print(f"  {name:>7}: {row_by_row:10.0f} row by row, {bulk:10.0f} add_data_rows")
+
+    print("create filled cells, cells per second:")
+    for name, generators, python, script in benchmark_create_cells(root):
+        print(
+            f"  {name:>7}: {generators:10.0f} generators, {python:10.0f} python, {script:10.0f} script"
+        )
+
+    unbatched, batched = benchmark_batch(root)
+    print("add_row with idle tasks, rows per second:")
+    print(f"  {unbatched:10.0f} unbatched, {batched:10.0f} in batch")
+
+    root.destroy()
@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from bisect import bisect_left, bisect_right
+import tkinter as tk
+from tkinter import ttk
+from tkinter.constants import *
+from table import (
+    _fill_values,
+    _get_generator_key,
+    get_title_row_generator,
+    get_readonly_row_generator,
+    get_input_row_generator_centered,
+)
+
+__doc__ = """
+Table drawn on a canvas, read only cells are canvas items instead of widgets
+"""
+
+CELL_PADDING = 3  # space between text and cell border like a gridded label
+MIN_COLUMN_WIDTH = 2 * CELL_PADDING + 1
+DEFAULT_FONT = "TkDefaultFont"
+SHIFT_REGION = 10**9  # horizontal extent when collecting items of rows to move
+
+
+class CanvasTable(tk.Canvas):
+    """
+    Table with the api of Table which draws read only rows as text and rectangle items
+    Input rows are embedded as window items
+    Needs the row generators of the table module to know how a row looks
+    """
+
+    def __init__(self, parent, **kwargs):
+        kwargs.setdefault("highlightthickness", 0)
+        tk.Canvas.__init__(self, parent, **kwargs)
+
+        self.rows = []
+        self.row_tops = []  # y position of each row, kept in sync with rows
+        self.column_widths = []
+
+        self._row_counter = 0
+        self._row_of_item = {}
+        self._row_of_widget = {}  # embedded widget -> canvas row
+        self._widget_widths = {}  # column -> widest embedded widget
+        self._line_heights = {}
+        self._dirty_columns = set()
+        self._layout_id = None
+
+    def get_row_count(self):
+        """
+        Returns number of rows
+        """
+
+        return len(self.rows)
+
+    def add_row(self, row_generator):
+        """
+        Adds new row to table end from generator
+        """
+
+        self.insert_row(len(self.rows), row_generator)
+
+    def add_rows(self, number_of_rows: int, row_generator):
+        """
+        Adds a number of rows at the end of the table from generator
+        """
+
+        for _ in range(number_of_rows):
+            self.add_row(row_generator)
+
+    def set(self, row: int, column: int, value):
+        """
+        Sets cell on position row column to value
+        """
+
+        canvas_row = self.rows[row]
+        canvas_row.values[column] = value
+
+        if canvas_row.widgets:
+            canvas_row.variables[column].set(value)
+        else:
+            self.itemconfigure(canvas_row.texts[column], text=value)
+            self._fit_row_height(row)  # lines might have been added or removed
+            self._dirty_columns.add(column)  # text might not fit anymore
+            self._schedule_layout()
+
+    def get(self, row: int, column: int):
+        """
+        Returns value from cell on position row column
+        """
+
+        return self.rows[row].values[column]
+
+    def get_row(self, row: int):
+        """
+        Returns values as list for row
+        """
+
+        return list(self.rows[row].values)
+
+    def set_row(self, row: int, values):
+        """
+        Sets cells on row
+        """
+
+        for column, value in enumerate(values):
+            self.set(row, column, value)
+
+    def remove_row(self, row: int):
+        """
+        Deletes row and closes gap
+        """
+
+        canvas_row = self.rows[row]
+        self._delete_row_items(canvas_row)
+
+        del self.rows[row]
+        top = self.row_tops.pop(row)
+        self._shift_rows(row, top, -canvas_row.height)
+
+    def remove_rows(self, rows):
+        """
+        Deletes rows given as range or list of row numbers and closes the gaps at once
+        """
+
+        all_rows = range(len(self.rows))
+        removed = sorted({all_rows[row] for row in rows})
+        if not removed:
+            return
+
+        self.delete(*[self.rows[row].tag for row in removed])
+        for row in removed:
+            self._forget_row_items(self.rows[row])
+
+        # move each block of rows between two removed rows up by the space freed above it
+        delta = 0
+        for index, row in enumerate(removed):
+            delta -= self.rows[row].height
+            if index + 1 < len(removed):
+                block_end = removed[index + 1]
+            else:
+                block_end = len(self.rows)
+            if block_end > row + 1:
+                self._move_area(
+                    self.row_tops[row + 1],
+                    self.row_tops[block_end - 1] + self.rows[block_end - 1].height,
+                    delta,
+                )
+
+        removed = set(removed)
+        self.rows = [
+            canvas_row for row, canvas_row in enumerate(self.rows) if row not in removed
+        ]
+        self._update_row_tops()
+        self._schedule_layout()
+
+    def insert_row(self, row: int, row_generator):
+        """
+        Inserts a row onto the position
+        """
+
+        if row < len(self.rows):
+            top = self.row_tops[row]
+        else:
+            top = self._get_total_height()
+
+        canvas_row = self._create_row(row_generator)
+        self._shift_rows(row, top, canvas_row.height)  # make room before drawing
+        self._draw_row(canvas_row, top)
+        self.rows.insert(row, canvas_row)
+        self.row_tops.insert(row, top)
+
+    def insert_rows(self, row: int, number_of_rows: int, row_generator):
+        """
+        Inserts a number of rows onto the position, moving the following rows only once
+        """
+
+        new_rows = [self._create_row(row_generator) for _ in range(number_of_rows)]
+        self._insert_canvas_rows(row, new_rows)
+
+    def add_data_rows(self, data_rows, row_generator):
+        """
+        Adds rows already filled with data rows at the end of the table
+        """
+
+        self.insert_data_rows(len(self.rows), data_rows, row_generator)
+
+    def insert_data_rows(self, row: int, data_rows, row_generator):
+        """
+        Inserts rows already filled with data rows onto the position, texts are drawn with their values
+        """
+
+        new_rows = []
+        for values in data_rows:
+            canvas_row = self._create_row(row_generator)
+            canvas_row.values = _fill_values(values, canvas_row.values)
+            if not canvas_row.widgets:  # tall enough for the lines of its texts
+                canvas_row.height = self._get_text_height(canvas_row)
+            new_rows.append(canvas_row)
+        self._insert_canvas_rows(row, new_rows)
+
+    def update_data(self, data_rows, row_generator, row: int = 0):
+        """
+        Updates the rows from row on to data rows and only sets the cells which changed
+        Rows drawn from the same kind of generator are kept, rows at the end are added or removed
+        Returns number of cells set, created or removed
+        """
+
+        data_rows = list(data_rows)
+        key = _get_generator_key(row_generator)
+
+        kept_rows = 0
+        for canvas_row in self.rows[row : row + len(data_rows)]:
+            if _get_generator_key(canvas_row.row_generator) != key:
+                break
+            kept_rows += 1
+
+        removed_rows = range(row + kept_rows, len(self.rows))
+        touched = sum([len(self.rows[removed].values) for removed in removed_rows])
+        self.remove_rows(removed_rows)
+
+        for offset, values in enumerate(data_rows[:kept_rows]):
+            canvas_row = self.rows[row + offset]
+            for column, value in enumerate(_fill_values(values, canvas_row.values)):
+                if self.get(row + offset, column) != value:
+                    self.set(row + offset, column, value)
+                    touched += 1
+
+        self.insert_data_rows(row + kept_rows, data_rows[kept_rows:], row_generator)
+        touched += sum(
+            [len(canvas_row.values) for canvas_row in self.rows[row + kept_rows :]]
+        )
+        return touched
+
+    def _insert_canvas_rows(self, row: int, new_rows):
+        if row < len(self.rows):
+            top = self.row_tops[row]
+        else:
+            top = self._get_total_height()
+
+        self._shift_rows(row, top, sum([canvas_row.height for canvas_row in new_rows]))
+
+        for canvas_row in new_rows:
+            self._draw_row(canvas_row, top)
+            top += canvas_row.height
+
+        self.rows[row:row] = new_rows
+        self._update_row_tops()
+
+    def replace_row(self, row: int, row_generator):
+        """
+        Replaces row with another generated row
+        """
+
+        old_row = self.rows[row]
+        self._delete_row_items(old_row)
+
+        top = self.row_tops[row]
+        canvas_row = self._create_row(row_generator)
+        self._shift_rows(
+            row + 1, top + old_row.height, canvas_row.height - old_row.height
+        )
+        self._draw_row(canvas_row, top)
+        self.rows[row] = canvas_row
+
+    def configure_row(self, row: int, **options):
+        """
+        Applies options like bg, fg or font to all cells of row
+        """
+
+        canvas_row = self.rows[row]
+        for widget in canvas_row.widgets:
+            widget.configure(**options)
+
+        if "bg" in options:
+            self.itemconfigure(f"{canvas_row.tag}&&rect", fill=options["bg"])
+        if "fg" in options:
+            self.itemconfigure(f"{canvas_row.tag}&&text", fill=options["fg"])
+        if "font" in options:
+            self.itemconfigure(f"{canvas_row.tag}&&text", font=options["font"])
+            canvas_row.font = options["font"]
+            if not canvas_row.widgets:
+                self._fit_row_height(row)
+            self._dirty_columns.update(range(len(canvas_row.values)))
+            self._schedule_layout()
+
+    def row_of(self, widget):
+        """
+        Returns row under the mouse if widget is this canvas, row of embedded widgets
+        or -1 if widget is not part of this table
+        """
+
+        if widget is self:
+            items = self.find_withtag(CURRENT)
+            if not items or items[0] not in self._row_of_item:
+                return -1
+            y = self.coords(items[0])[1]
+            return self.row_at(y)
+
+        canvas_row = self._row_of_widget.get(widget)
+        if canvas_row is None:
+            return -1
+        return self.row_at(self.coords(canvas_row.windows[0])[1])
+
+    def row_at(self, y: float):
+        """
+        Returns row at canvas position y or -1 if there is no row
+        """
+
+        row = bisect_right(self.row_tops, y) - 1
+        if row < 0 or y >= self.row_tops[row] + self.rows[row].height:
+            return -1
+        return row
+
+    def get_rows_between(self, top: float, bottom: float):
+        """
+        Returns (first_row, last_row) of the rows in the pixel range top to bottom of the canvas,
+        last_row is excluded
+        """
+
+        first_row = max(0, bisect_right(self.row_tops, top) - 1)
+        if first_row < len(self.rows) and (
+            self.row_tops[first_row] + self.rows[first_row].height <= top
+        ):
+            first_row += 1  # top is below the last row
+        last_row = bisect_left(self.row_tops, bottom)
+        return (first_row, max(first_row, last_row))
+
+    def _get_total_height(self):
+        if not self.rows:
+            return 0
+        return self.row_tops[-1] + self.rows[-1].height
+
+    def _get_line_height(self, font):
+        if font not in self._line_heights:
+            self._line_heights[font] = self.tk.getint(
+                self.tk.call("font", "metrics", font, "-linespace")
+            )
+        return self._line_heights[font]
+
+    def _get_text_height(self, canvas_row):
+        """
+        Returns height of a read only row fitting the text with the most lines,
+        texts do not wrap so their lines are the lines of the values
+        """
+
+        lines = max(
+            [str(value).count("\n") + 1 for value in canvas_row.values], default=1
+        )
+        return lines * self._get_line_height(canvas_row.font) + 2 * CELL_PADDING
+
+    def _fit_row_height(self, row: int):
+        """
+        Sizes a read only row to its texts, its items stay enclosed in its area for _move_area
+        """
+
+        row = range(len(self.rows))[row]
+        canvas_row = self.rows[row]
+        height = self._get_text_height(canvas_row)
+        old_height = canvas_row.height
+        if height == old_height:
+            return
+
+        top = self.row_tops[row]
+        self._shift_rows(row + 1, top + old_height, height - old_height)
+        self.scale(
+            f"{canvas_row.tag}&&rect", 0, top + 1, 1, (height - 2) / (old_height - 2)
+        )
+        self.move(f"{canvas_row.tag}&&text", 0, (height - old_height) / 2)
+        canvas_row.height = height
+
+    def _get_column_left(self, column: int):
+        while len(self.column_widths) <= column:
+            self.column_widths.append(MIN_COLUMN_WIDTH)
+        return sum(self.column_widths[:column])
+
+    def _create_row(self, row_generator):
+        widget_class = getattr(row_generator, "widget_class", None)
+        if widget_class is None:
+            raise ValueError("canvas table needs a row generator from the table module")
+
+        options = dict(row_generator.options)
+        columns = row_generator.columns
+
+        self._row_counter += 1
+        canvas_row = _CanvasRow(row_generator, f"row{self._row_counter}", columns)
+
+        if widget_class is tk.Label:
+            canvas_row.font = options.get("font", DEFAULT_FONT)
+            canvas_row.height = self._get_text_height(canvas_row)
+        else:  # input rows keep real widgets, embedded as window items
+            for column in range(columns):
+                variable = tk.StringVar(self)
+                variable.trace_add(
+                    "write",
+                    lambda *args, column=column, variable=variable: self._on_variable_write(
+                        canvas_row, column, variable
+                    ),
+                )
+                canvas_row.variables.append(variable)
+                canvas_row.widgets.append(
+                    widget_class(self, options, textvariable=variable)
+                )
+            canvas_row.height = (
+                max(
+                    [widget.winfo_reqheight() for widget in canvas_row.widgets],
+                    default=0,
+                )
+                + 2
+            )
+
+        return canvas_row
+
+    def _on_variable_write(self, canvas_row, column: int, variable):
+        canvas_row.values[column] = (
+            variable.get()
+        )  # user input goes to the values read by get
+
+    def _draw_row(self, canvas_row, top: float):
+        options = canvas_row.row_generator.options
+
+        for column in range(len(canvas_row.values)):
+            left = self._get_column_left(column)
+            width = self.column_widths[column]
+            tags = (canvas_row.tag, f"col{column}")
+
+            if canvas_row.widgets:
+                item = self.create_window(
+                    left + 1,
+                    top + 1,
+                    window=canvas_row.widgets[column],
+                    anchor=NW,
+                    width=width - 2,
+                    height=canvas_row.height - 2,
+                    tags=tags + ("window",),
+                )
+                canvas_row.windows.append(item)
+                self._row_of_widget[canvas_row.widgets[column]] = canvas_row
+                if canvas_row.values[column] != "":
+                    canvas_row.variables[column].set(canvas_row.values[column])
+
+                widget_width = canvas_row.widgets[column].winfo_reqwidth() + 2
+                if widget_width > self._widget_widths.get(column, 0):
+                    self._widget_widths[column] = widget_width
+                    self._dirty_columns.add(column)
+            else:
+                rect = self.create_rectangle(
+                    left + 1,
+                    top + 1,
+                    left + width - 1,
+                    top + canvas_row.height - 1,
+                    fill=options.get("bg", ""),
+                    outline="",
+                    tags=tags + ("rect",),
+                )
+                text = self.create_text(
+                    left + width / 2,
+                    top + canvas_row.height / 2,
+                    text=canvas_row.values[column],
+                    font=canvas_row.font,
+                    fill=options.get("fg", "black"),
+                    justify=CENTER,
+                    tags=tags + ("text",),
+                )
+                canvas_row.rects.append(rect)
+                canvas_row.texts.append(text)
+                self._row_of_item[rect] = canvas_row
+                self._row_of_item[text] = canvas_row
+                self._dirty_columns.add(column)
+
+        self._schedule_layout()
+
+    def _update_row_tops(self):
+        self.row_tops = []
+        top = 0
+        for canvas_row in self.rows:
+            self.row_tops.append(top)
+            top += canvas_row.height
+
+    def _delete_row_items(self, canvas_row):
+        self.delete(canvas_row.tag)
+        self._forget_row_items(canvas_row)
+
+    def _forget_row_items(self, canvas_row):
+        for item in canvas_row.rects + canvas_row.texts:
+            del self._row_of_item[item]
+        for widget in canvas_row.widgets:
+            del self._row_of_widget[widget]
+            widget.destroy()
+
+    def _shift_rows(self, row: int, top: float, delta: float):
+        """
+        Moves all rows from row on by delta, rows are found by area to need only a few canvas calls
+        """
+
+        if row < len(self.rows) and delta != 0:
+            self._move_area(top, self._get_total_height(), delta)
+
+            for follow_up_row in range(row, len(self.rows)):
+                self.row_tops[follow_up_row] += delta
+
+        self._schedule_layout()
+
+    def _move_area(self, top: float, bottom: float, delta: float):
+        # rows are sized to their items, so all items of the rows in the area are enclosed
+        self.addtag_enclosed("shift", -SHIFT_REGION, top - 1, SHIFT_REGION, bottom + 1)
+        self.move("shift", 0, delta)
+        self.dtag("shift", "shift")
+
+    def _schedule_layout(self):
+        if self._layout_id is None:
+            self._layout_id = self.after_idle(self._layout)
+
+    def _layout(self):
+        """
+        Fits column widths to their widest text in one pass and updates the scroll region
+        """
+
+        self._layout_id = None
+
+        for column in sorted(self._dirty_columns):
+            width = max(self._widget_widths.get(column, 0), MIN_COLUMN_WIDTH)
+            bbox = self.bbox(f"col{column}&&text")
+            if not bbox is None:
+                width = max(bbox[2] - bbox[0] + 2 * CELL_PADDING, width)
+
+            old_width = self.column_widths[column]
+            if width <= old_width:  # columns only grow like in a grid
+                continue
+
+            left = self._get_column_left(column)
+            delta = width - old_width
+            self.column_widths[column] = width
+
+            self.scale(
+                f"col{column}&&rect", left + 1, 0, (width - 2) / (old_width - 2), 1
+            )
+            self.move(f"col{column}&&text", delta / 2, 0)
+            self.itemconfigure(f"col{column}&&window", width=width - 2)
+            for follow_up_column in range(column + 1, len(self.column_widths)):
+                self.move(f"col{follow_up_column}", delta, 0)
+
+        self._dirty_columns.clear()
+
+        self.configure(
+            scrollregion=f"0 0 {sum(self.column_widths)} {self._get_total_height()}"
+        )
+
+
+class _CanvasRow:
+    """
+    Items and values of a row drawn on a canvas table
+    """
+
+    def __init__(self, row_generator, tag: str, columns: int):
+        self.row_generator = row_generator
+        self.tag = tag  # canvas tag of all items of this row
+        self.values = [""] * columns
+        self.height = 0
+        self.font = None  # font of the texts of read only rows
+        self.rects = []
+        self.texts = []
+        self.widgets = []  # embedded widgets of input rows
+        self.variables = []  # text variables of the widgets, mirrored into values
+        self.windows = []
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate canvas table
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.table = CanvasTable(self, width=400, height=400)
+            self.scrollbar = ttk.Scrollbar(
+                self, orient=VERTICAL, command=self.table.yview
+            )
+            self.table.configure(yscrollcommand=self.scrollbar.set)
+            self.scrollbar.pack(side=RIGHT, fill=Y)
+            self.table.pack(side=LEFT, fill=BOTH, expand=TRUE)
+
+            self.table.add_row(get_title_row_generator(5))
+            self.table.set_row(0, ["a", "b", "c", "d", "e"])
+            self.table.add_rows(20000, get_readonly_row_generator(5))
+            self.table.add_row(get_input_row_generator_centered(5))
+
+            for row in range(1, self.table.get_row_count()):
+                for column in range(5):
+                    self.table.set(row, column, f"test {row} {column}")
+
+            self.table.configure_row(2, bg="deepskyblue")
+
+    app = SampleApp()
+    app.mainloop()
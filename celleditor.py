@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import tkinter as tk
+from tkinter.constants import *
+from table import Table, get_readonly_row_generator
+
+__doc__ = """
+One entry shared by all cells of a table to edit read only rows
+"""
+
+
+class CellEditor(tk.Entry):
+    """
+    Entry placed over the cell being edited, read only rows stay labels
+    Commits on Return, Tab or focus out, Escape cancels
+    """
+
+    def __init__(self, table, first_row: int = 0, **kwargs):
+        kwargs.setdefault("justify", "center")
+        tk.Entry.__init__(self, table, **kwargs)
+
+        self.table = table
+        self.table.cell_editor = self  # the table moves the editor with its rows
+        self.first_row = first_row  # rows above, like a title, are not edited
+
+        self.row_id = None  # model row being edited, stays valid while rows move
+        self.column = -1
+        self.start_value = None
+
+        self.bind("<Return>", lambda event: self._on_return())
+        self.bind("<KP_Enter>", lambda event: self._on_return())
+        self.bind("<Tab>", lambda event: self._on_tab(1))
+        self.bind("<Shift-Tab>", lambda event: self._on_tab(-1))
+        self.bind("<ISO_Left_Tab>", lambda event: self._on_tab(-1))
+        self.bind("<Escape>", lambda event: self.cancel())
+        self.bind("<FocusOut>", lambda event: self.commit())
+
+    def is_editing(self):
+        """
+        Returns True while a cell is edited
+        """
+
+        return not self.row_id is None
+
+    def get_cell(self):
+        """
+        Returns (row, column) of the edited cell or (-1, -1)
+        """
+
+        if self.row_id is None:
+            return (-1, -1)
+
+        try:
+            return (self.table.model.get_position(self.row_id), self.column)
+        except KeyError:  # row was removed
+            return (-1, -1)
+
+    def edit(self, row: int, column: int):
+        """
+        Commits the current cell and opens the editor over cell on position row column
+        Virtual tables scroll to rows which are not rendered
+        """
+
+        self.commit()
+        if not self.first_row <= row < self.table.get_row_count():
+            return
+
+        widget = self.table.get_cell_widget(row, column)
+        if widget is None and hasattr(self.table, "scroll_to_row"):
+            self.table.scroll_to_row(row)
+            self.table.update_idletasks()  # the rows in view get rendered
+            widget = self.table.get_cell_widget(row, column)
+        if widget is None:
+            return
+
+        self.row_id = self.table.model.get_row_id(row)
+        self.column = column
+        self.start_value = self.table.get(row, column)
+
+        self.delete(0, END)
+        self.insert(0, self.start_value)
+        self.select_range(0, END)
+        self.place(in_=widget, x=0, y=0, relwidth=1, relheight=1)
+        self.lift()
+        self.focus_set()
+
+    def commit(self):
+        """
+        Writes the edited value back into the table and hides the editor
+        """
+
+        row, column = self.get_cell()
+        value = self.get()
+        self._close()
+
+        if row >= 0 and value != self.start_value:  # keeps values set while editing
+            self.table.set(row, column, value)
+
+    def cancel(self):
+        """
+        Hides the editor without changing the table
+        """
+
+        self._close()
+
+    def follow(self):
+        """
+        Moves the editor to the widget now showing the edited cell or hides it,
+        closes it once the edited row got removed
+        """
+
+        row, column = self.get_cell()
+        if row < 0:  # its label may show another row from the pool now
+            self._close()
+            return
+
+        widget = self.table.get_cell_widget(row, column)
+        if widget is None:
+            self.place_forget()  # edit goes on, value is committed later
+        else:
+            self.place(in_=widget, x=0, y=0, relwidth=1, relheight=1)
+            self.lift()
+
+    def _close(self):
+        self.row_id = None
+        self.column = -1
+        self.place_forget()
+
+    def _on_return(self):
+        self.commit()
+        self.table.focus_set()
+        return "break"
+
+    def _on_tab(self, step: int):
+        row, column = self.get_cell()
+        self.commit()
+
+        if row >= 0:
+            columns = len(self.table.get_row(row))
+            column += step
+            if column >= columns:  # continue on the next row
+                row, column = row + 1, 0
+            elif column < 0:
+                row, column = row - 1, columns - 1
+            if self.first_row <= row < self.table.get_row_count():
+                self.edit(row, column)
+        return "break"  # keep the focus traversal out
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate cell editor
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.table = Table(self)
+            self.table.add_data_rows(
+                [[f"{row} {column}" for column in range(4)] for row in range(20)],
+                get_readonly_row_generator(4),
+            )
+            self.table.pack()
+
+            self.editor = CellEditor(self.table)
+            self.bind_class(
+                self.table.bindtag,
+                "<Double-Button-1>",
+                lambda event: self.editor.edit(*self.table.cell_of(event.widget)),
+            )
+
+            self.button = tk.Button(
+                self,
+                text="print table data",
+                command=lambda: print(self.table.get_rows()),
+            )
+            self.button.pack()
+
+    app = SampleApp()
+    app.mainloop()
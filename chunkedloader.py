@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from itertools import islice
+from time import perf_counter
+import tkinter as tk
+from tkinter import ttk
+from tkinter.constants import *
+from table import Table, get_readonly_row_generator
+
+__doc__ = """
+Loads data rows into a table in short slices, the mainloop keeps handling events in between
+"""
+
+SLICE_TIME = 8  # milliseconds of loading per slice
+SLICE_DELAY = 1  # milliseconds between slices, lets tk redraw before the next slice
+FIRST_ROWS = 50  # rows of the first slice, about a screenful
+
+
+class ChunkedLoader:
+    """
+    Adds data rows to a table in slices scheduled with after, each slice takes about slice time
+    The first slice adds the first rows, a screenful, whatever it takes so they show right away
+    """
+
+    def __init__(
+        self,
+        table,
+        data_rows,
+        row_generator,
+        row: int = None,
+        on_progress=None,
+        on_done=None,
+        slice_time: float = SLICE_TIME,
+        first_rows: int = FIRST_ROWS,
+    ):
+        self.table = table
+        self.row_generator = row_generator
+        self.row = row  # position of the first loaded row, None appends
+        self.on_progress = on_progress  # called with (loaded rows, total rows or None)
+        self.on_done = on_done  # called with loaded rows once all rows are loaded
+        self.slice_time = slice_time
+        self.slice_rows = first_rows  # rows of the next slice, adapted to the speed
+
+        self.total = None  # unknown for iterators
+        if hasattr(data_rows, "__len__"):
+            self.total = len(data_rows)
+        self.loaded = 0
+        self.done = False
+
+        self._rows = iter(data_rows)
+        self._after_id = None
+
+    def start(self):
+        """
+        Schedules the first slice, returns the loader
+        """
+
+        if self._after_id is None and not self.done:
+            self._after_id = self.table.after_idle(self._load_slice)
+        return self
+
+    def cancel(self):
+        """
+        Stops loading, rows loaded so far stay in the table
+        """
+
+        if not self._after_id is None:
+            self.table.after_cancel(self._after_id)
+            self._after_id = None
+        self.done = True
+
+    def is_running(self):
+        """
+        Returns True while rows are left to load
+        """
+
+        return not self.done
+
+    def _load_slice(self):
+        self._after_id = None
+
+        start = perf_counter()
+        slice_rows = self.slice_rows
+        data_rows = list(islice(self._rows, slice_rows))
+        if data_rows:
+            with self.table.batch():  # laid out once per slice
+                if self.row is None:
+                    self.table.add_data_rows(data_rows, self.row_generator)
+                else:
+                    self.table.insert_data_rows(
+                        self.row + self.loaded, data_rows, self.row_generator
+                    )
+            self.loaded += len(data_rows)
+
+            # as many rows as fit into the slice time at the measured speed, at most twice as many
+            milliseconds = max((perf_counter() - start) * 1000, 0.001)
+            rows_in_time = int(len(data_rows) * self.slice_time / milliseconds)
+            self.slice_rows = max(1, min(rows_in_time, 2 * len(data_rows)))
+
+        finished = len(data_rows) < slice_rows or self.loaded == self.total
+        if not finished:
+            self._after_id = self.table.after(SLICE_DELAY, self._load_slice)
+        else:
+            self.done = True
+
+        if not self.on_progress is None:
+            self.on_progress(self.loaded, self.total)
+        if finished and not self.on_done is None:
+            self.on_done(self.loaded)
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate chunked loading
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.label = ttk.Label(self, text="loading")
+            self.label.pack()
+
+            self.table = Table(self)
+            self.table.pack()
+
+            self.loader = ChunkedLoader(
+                self.table,
+                [[f"{row} {column}" for column in range(4)] for row in range(2000)],
+                get_readonly_row_generator(4),
+                on_progress=lambda loaded, total: self.label.configure(
+                    text=f"{loaded} of {total} rows"
+                ),
+            ).start()
+
+            self.button = tk.Button(self, text="cancel", command=self.loader.cancel)
+            self.button.pack()
+
+    app = SampleApp()
+    app.mainloop()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+__doc__ = """
+Row heights with prefix sums to map pixel offsets and rows
+"""
+
+
+class RowHeights:
+    """
+    Heights of rows in a fenwick tree
+    Offset of a row, row at an offset and height changes in O(log n),
+    appending few rows in O(log n) per row, inserting or removing rebuilds in O(n)
+    """
+
+    def __init__(self, heights=()):
+        self.heights = list(heights)
+        self._build()
+
+    def get_row_count(self):
+        """
+        Returns number of rows
+        """
+
+        return len(self.heights)
+
+    def get_height(self, row: int):
+        """
+        Returns height of row
+        """
+
+        return self.heights[row]
+
+    def set_height(self, row: int, height: int):
+        """
+        Sets height of row
+        """
+
+        delta = height - self.heights[row]
+        if delta == 0:
+            return
+
+        self.heights[row] = height
+        self.total += delta
+
+        index = row + 1
+        while index < len(self.tree):
+            self.tree[index] += delta
+            index += index & -index
+
+    def get_offset(self, row: int):
+        """
+        Returns pixel offset of the top of row, row count gives the total height
+        """
+
+        offset = 0
+        index = row
+        while index > 0:
+            offset += self.tree[index]
+            index -= index & -index
+        return offset
+
+    def get_total_height(self):
+        """
+        Returns height of all rows
+        """
+
+        return self.total
+
+    def row_at(self, offset: float):
+        """
+        Returns row containing pixel offset, 0 above the first and row count below the last row
+        """
+
+        if offset < 0:
+            return 0
+
+        row = 0
+        step = 1
+        while step * 2 < len(self.tree):
+            step *= 2
+
+        # walk down the tree, skipping blocks of rows which end at or above offset
+        while step > 0:
+            index = row + step
+            if index < len(self.tree) and self.tree[index] <= offset:
+                row = index
+                offset -= self.tree[index]
+            step //= 2
+        return row
+
+    def append_rows(self, heights):
+        """
+        Adds rows of heights at the end
+        """
+
+        heights = list(heights)
+        if (
+            len(heights) > len(self.heights) // 8
+        ):  # one rebuild is cheaper for many rows
+            self.heights += heights
+            self._build()
+            return
+
+        for height in heights:
+            index = len(self.tree)
+            lowest = index & -index
+            # node covers the rows from index - lowest + 1 to index
+            self.tree.append(
+                self.get_offset(index - 1) - self.get_offset(index - lowest) + height
+            )
+            self.heights.append(height)
+            self.total += height
+
+    def insert_rows(self, row: int, heights):
+        """
+        Inserts rows of heights onto the position
+        """
+
+        if row >= len(self.heights):
+            self.append_rows(heights)
+            return
+
+        self.heights[row:row] = heights
+        self._build()
+
+    def remove_rows(self, rows):
+        """
+        Removes rows given as range or list of row numbers
+        """
+
+        all_rows = range(len(self.heights))
+        removed = {all_rows[row] for row in rows}
+        if not removed:
+            return
+
+        if min(removed) >= len(self.heights) - len(removed):  # only the tail
+            del self.heights[min(removed) :]
+            del self.tree[min(removed) + 1 :]
+            self.total = self.get_offset(len(self.heights))
+            return
+
+        first, last = min(removed), max(removed)
+        if last - first + 1 == len(removed):
+            del self.heights[first : last + 1]
+        else:
+            self.heights = [
+                height for row, height in enumerate(self.heights) if row not in removed
+            ]
+        self._build()
+
+    def _build(self):
+        self.tree = [0] + self.heights
+        for index in range(1, len(self.tree)):
+            parent = index + (index & -index)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[index]
+        self.total = sum(self.heights)
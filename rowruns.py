@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from bisect import bisect_left, bisect_right
+
+__doc__ = """
+Value per row stored once for each run of rows with the same value
+"""
+
+
+class RowRuns:
+    """
+    Values of rows as runs of equal values, like the generators of the rows of a table
+    Value of a row in O(log r) for r runs, inserting and removing rows in O(r + k) for k rows
+    """
+
+    def __init__(self):
+        self.starts = []  # first row of each run
+        self.values = []  # value of each run
+        self.row_count = 0
+
+    def get_row_count(self):
+        """
+        Returns number of rows
+        """
+
+        return self.row_count
+
+    def get(self, row: int):
+        """
+        Returns value of row
+        """
+
+        if not 0 <= row < self.row_count:
+            raise IndexError("row out of range")
+        return self.values[bisect_right(self.starts, row) - 1]
+
+    def get_values(self, start: int = 0, stop: int = None):
+        """
+        Returns values of the rows from start to stop as list
+        """
+
+        start, stop, _ = slice(start, stop).indices(self.row_count)
+        values = []
+        run = bisect_right(self.starts, start) - 1
+        while start < stop:
+            end = self.row_count
+            if run + 1 < len(self.starts):
+                end = self.starts[run + 1]
+            end = min(end, stop)
+            values += [self.values[run]] * (end - start)
+            start = end
+            run += 1
+        return values
+
+    def insert_rows(self, row: int, number_of_rows: int, value):
+        """
+        Inserts a number of rows of value onto the position
+        """
+
+        if number_of_rows <= 0:
+            return
+
+        row = min(max(row, 0), self.row_count)
+        run = bisect_left(self.starts, row)  # first run starting at row or below
+        if run > 0 and self.values[run - 1] == value:  # the run above grows
+            self._shift(run, number_of_rows)
+        elif (
+            run < len(self.starts)
+            and self.starts[run] == row
+            and self.values[run] == value
+        ):
+            self._shift(run + 1, number_of_rows)
+        else:
+            end = self.row_count
+            if run < len(self.starts):
+                end = self.starts[run]
+            if run > 0 and row < end:  # row is inside the run above, split it
+                self.starts.insert(run, row)
+                self.values.insert(run, self.values[run - 1])
+            self.starts.insert(run, row)
+            self.values.insert(run, value)
+            self._shift(run + 1, number_of_rows)
+        self.row_count += number_of_rows
+
+    def remove_rows(self, rows):
+        """
+        Removes rows given as range or list of row numbers, neighbouring runs of one value merge
+        """
+
+        all_rows = range(self.row_count)
+        removed = {all_rows[row] for row in rows}
+        if not removed:
+            return
+
+        lengths = [
+            end - start
+            for start, end in zip(self.starts, self.starts[1:] + [self.row_count])
+        ]
+        for row in removed:
+            lengths[bisect_right(self.starts, row) - 1] -= 1
+
+        starts = []
+        values = []
+        start = 0
+        for value, length in zip(self.values, lengths):
+            if length == 0:
+                continue
+            if not values or values[-1] != value:
+                starts.append(start)
+                values.append(value)
+            start += length
+        self.starts = starts
+        self.values = values
+        self.row_count = start
+
+    def _shift(self, run: int, number_of_rows: int):
+        for index in range(run, len(self.starts)):
+            self.starts[index] += number_of_rows
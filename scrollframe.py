@@ -17,6 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import weakref
 import tkinter as tk
 from tkinter import ttk
 from tkinter.constants import *
@@ -25,6 +26,12 @@ __doc__ = """
 Scrolled frame based on https://web.archive.org/web/20170514022131id_/http://tkinter.unpythonic.net/wiki/VerticalScrolledFrame
 """
 
+VIRTUAL_SCROLL_UNIT = 20  # pixels per scroll unit in virtual coordinates
+PLACEHOLDER_MARGIN = 200  # pixels around the view in which placeholders get filled
+VISIBLE_RANGE_DELAY = (
+    50  # milliseconds without scrolling or resizing before range listeners are called
+)
+
 
 class ScrolledFrame(ttk.Frame):
     """
@@ -44,6 +51,30 @@ class ScrolledFrame(ttk.Frame):
     ):
         ttk.Frame.__init__(self, parent, *args, **kwargs)
 
+        self.view_listeners = []
+        self.visible_range_listeners = []
+        self.visible_rows_listeners = []  # (table, callback)
+        self.visible_range_delay = VISIBLE_RANGE_DELAY
+
+        self._view = (0.0, 1.0)  # last visible fraction of the interior
+        self._interior_height = 0  # height of the scroll region
+        self._visible_range_id = None
+
+        # lazy children in the order they are stacked in the interior
+        self.placeholders = []
+        self.placeholder_margin = PLACEHOLDER_MARGIN
+        self._placeholder_id = None
+
+        self._update_id = None
+        self._frozen = 0  # freeze depth, scroll region waits until thawed
+        self._scroll_to_end = False  # scroll down again once the region grew
+
+        # virtual coordinates, the content scrolls itself inside a view sized interior
+        self.virtual_height = None  # logical content height, None for normal scrolling
+        self.virtual_top = 0  # logical pixel at the top of the view
+        self._virtual_shift = 0
+        self._canvas_height = 0
+
         # create canvas and scrollbar for it
         self.vertical_scrollbar = ttk.Scrollbar(self, orient=VERTICAL)
         self.vertical_scrollbar_visible = False
@@ -57,7 +88,7 @@ class ScrolledFrame(ttk.Frame):
             self,
             bd=0,
             highlightthickness=0,
-            yscrollcommand=self.vertical_scrollbar.set,
+            yscrollcommand=self._on_yview,
             xscrollcommand=self.horizontal_scrollbar.set,
         )
         self.canvas.pack(side=LEFT, fill=BOTH, expand=TRUE)
@@ -71,30 +102,38 @@ class ScrolledFrame(ttk.Frame):
 
         # create frame inside canvas which will be scrolled
         self.interior = ttk.Frame(self.canvas)
-        interior_id = self.canvas.create_window(0, 0, window=self.interior, anchor=NW)
+        self._interior_id = self.canvas.create_window(
+            0, 0, window=self.interior, anchor=NW
+        )
 
         # track changes to canvas and frame width and sync them, update scrollbar
-        def _configure_interior(event):
-            # update scrollbar size to match frame
-            size = (self.interior.winfo_reqwidth(), self.interior.winfo_reqheight())
-            self.canvas.config(scrollregion=f"0 0 {size[0]} {size[1]}")
-
-            if self.interior.winfo_reqwidth() != self.canvas.winfo_width():
-                # update with of canvas to fit inner frame
-                self.canvas.config(width=self.interior.winfo_reqwidth())
-
-        self.interior.bind("<Configure>", _configure_interior)
+        # many configure events during bulk changes lead to one update when idle
+        self.interior.bind("<Configure>", lambda event: self._schedule_update())
 
         def _configure_canvas(event):
             if self.interior.winfo_reqwidth() != self.canvas.winfo_width():
                 # update inner frame width to fill canvas
-                self.canvas.itemconfigure(interior_id, width=self.canvas.winfo_width())
+                self.canvas.itemconfigure(
+                    self._interior_id, width=self.canvas.winfo_width()
+                )
+
+            self._canvas_height = event.height
+            if not self.virtual_height is None:  # view got taller or smaller
+                self._set_virtual_top(self.virtual_top)
 
         self.canvas.bind("<Configure>", _configure_canvas)
 
-        # dynamic bind scroll wheel if mouse over
-        self.interior.bind_all("<Enter>", self._bind_mousewheel)
-        self.interior.bind_all("<Leave>", self._unbind_mousewheel)
+        # scroll wheel bound once on a tag of this frame, widgets with the tag scroll it
+        self.bindtag = f"ScrolledFrame{self}"
+        self._tagged_widgets = weakref.WeakSet()  # no tcl call for them again
+        self.bind_class(self.bindtag, "<MouseWheel>", self._on_scroll)
+
+        # X11 compatibility
+        self.bind_class(self.bindtag, "<Button-4>", self._scroll_up)
+        self.bind_class(self.bindtag, "<Button-5>", self._scroll_down)
+
+        self.add_bindtag(self.canvas)
+        self.add_bindtag(self.interior)
 
     def show_vertical_scrollbar(self, visible: bool):
         """
@@ -118,28 +157,367 @@ class ScrolledFrame(ttk.Frame):
         else:
             self.horizontal_scrollbar.pack_forget()
 
+    def freeze(self):
+        """
+        Holds back scroll region updates until the matching thaw
+        Use as context manager for bulk changes of the content
+        """
+
+        self._frozen += 1
+        return _Frozen(self)
+
+    def thaw(self):
+        """
+        Ends a freeze, the scroll region gets updated once all freezes ended
+        """
+
+        if self._frozen > 0:
+            self._frozen -= 1
+        if self._frozen == 0:
+            self._schedule_update()
+
+    def _schedule_update(self):
+        if self._update_id is None and self._frozen == 0:
+            self._update_id = self.after_idle(self._update_scroll_region)
+
+    def _update_scroll_region(self):
+        self._update_id = None
+        if self._frozen > 0:
+            return
+
+        # update scrollbar size to match frame
+        width = self.interior.winfo_reqwidth()
+        height = self.interior.winfo_reqheight()
+        self.canvas.config(scrollregion=f"0 0 {width} {height}")
+        self._interior_height = height
+        self.add_bindtag(self.interior)  # children added meanwhile, each tagged once
+
+        if self._scroll_to_end:
+            self._scroll_to_end = False
+            if self.virtual_height is None:
+                self.canvas.yview_moveto(1.0)
+
+        if width != self.canvas.winfo_width():
+            # update with of canvas to fit inner frame
+            self.canvas.config(width=width)
+
+    def add_view_listener(self, callback):
+        """
+        Registers callback(first, last) called with the visible fraction of the interior
+        """
+
+        self.view_listeners.append(callback)
+
+    def remove_view_listener(self, callback):
+        """
+        Unregisters a callback added by add_view_listener
+        """
+
+        self.view_listeners.remove(callback)
+
+    def add_visible_range_listener(self, callback):
+        """
+        Registers callback(top, bottom) called with the visible pixel range of the interior
+        Called once scrolling or resizing paused for visible_range_delay milliseconds
+        """
+
+        self.visible_range_listeners.append(callback)
+        self._schedule_visible_range()
+
+    def remove_visible_range_listener(self, callback):
+        """
+        Unregisters a callback added by add_visible_range_listener
+        """
+
+        self.visible_range_listeners.remove(callback)
+
+    def add_visible_rows_listener(self, table, callback):
+        """
+        Registers callback(first_row, last_row) called with the rows of a table in the interior
+        which are in view, last_row is excluded. Called like the visible range listeners
+        """
+
+        self.visible_rows_listeners.append((table, callback))
+        self._schedule_visible_range()
+
+    def remove_visible_rows_listener(self, table, callback):
+        """
+        Unregisters a callback added by add_visible_rows_listener
+        """
+
+        self.visible_rows_listeners.remove((table, callback))
+
+    def get_visible_range(self):
+        """
+        Returns visible pixel range (top, bottom) of the interior
+        """
+
+        height = self._interior_height
+        if not self.virtual_height is None:
+            height = self.virtual_height
+
+        first, last = self._view
+        return (first * height, last * height)
+
+    def _schedule_visible_range(self):
+        if not self.visible_range_listeners and not self.visible_rows_listeners:
+            return
+
+        if not self._visible_range_id is None:  # restart the delay, debounce
+            self.after_cancel(self._visible_range_id)
+        self._visible_range_id = self.after(
+            self.visible_range_delay, self._notify_visible_range
+        )
+
+    def _notify_visible_range(self):
+        self._visible_range_id = None
+
+        top, bottom = self.get_visible_range()
+        for callback in list(self.visible_range_listeners):
+            callback(top, bottom)
+
+        if self.visible_rows_listeners:
+            interior_top = self.interior.winfo_rooty()
+            for table, callback in list(self.visible_rows_listeners):
+                offset = 0  # content starts at the top in virtual coordinates
+                if self.virtual_height is None:  # table position in interior
+                    offset = table.winfo_rooty() - interior_top
+                callback(*table.get_rows_between(top - offset, bottom - offset))
+
+    def add_placeholder(self, height: int, factory, destroy_hidden: bool = False):
+        """
+        Adds an empty frame of estimated height to the end of the interior, factory(frame)
+        creates its content once it comes near the view. With destroy_hidden the content
+        gets destroyed again after it left the view. Returns the frame
+        """
+
+        frame = tk.Frame(self.interior, height=height)
+        frame.pack_propagate(False)  # keep the estimated height while empty
+        frame.grid_propagate(False)
+        frame.pack(side=TOP, fill=X)
+        self.add_bindtag(frame)
+
+        self.placeholders.append(_Placeholder(frame, height, factory, destroy_hidden))
+        self._schedule_placeholders()
+        return frame
+
+    def _schedule_placeholders(self):
+        if self._placeholder_id is None and self.placeholders:
+            self._placeholder_id = self.after_idle(self._update_placeholders)
+
+    def _update_placeholders(self):
+        """
+        Fills placeholders near the view and empties the ones which left it if wanted
+        Positions come from the heights, placeholders are stacked without gaps
+        """
+
+        self._placeholder_id = None
+        if not self.placeholders:
+            return
+
+        top, bottom = self.get_visible_range()
+        top -= self.placeholder_margin
+        bottom += self.placeholder_margin
+
+        y = self.placeholders[0].frame.winfo_y()
+        for placeholder in self.placeholders:
+            if placeholder.filled:  # real height known now
+                placeholder.height = placeholder.frame.winfo_reqheight()
+
+            near = y < bottom and y + placeholder.height > top
+            if near and not placeholder.filled:
+                self._fill_placeholder(placeholder)
+            elif not near and placeholder.filled and placeholder.destroy_hidden:
+                self._empty_placeholder(placeholder)
+            y += placeholder.height
+
+    def _fill_placeholder(self, placeholder):
+        placeholder.frame.pack_propagate(True)
+        placeholder.frame.grid_propagate(True)
+        placeholder.factory(placeholder.frame)
+        self.add_bindtag(placeholder.frame)  # scroll over the new content too
+        placeholder.filled = True
+
+    def _empty_placeholder(self, placeholder):
+        for child in list(placeholder.frame.children.values()):
+            child.destroy()
+        placeholder.frame.configure(
+            height=placeholder.height
+        )  # keeps the last real height
+        placeholder.frame.pack_propagate(False)
+        placeholder.frame.grid_propagate(False)
+        placeholder.filled = False
+
+    def set_virtual_height(self, height):
+        """
+        Switches to virtual coordinates for content of any height, also beyond the window size limits of tk
+        The scrollbar covers height logical pixels while only the interior, sized to the view, is laid out.
+        View listeners get fractions of height and lay out what is in view themselves, content starts at
+        the top. None switches back to normal scrolling
+        """
+
+        if height is None:
+            self.virtual_height = None
+            self.virtual_top = 0
+            self.set_virtual_shift(0)
+            self.vertical_scrollbar.config(command=self.canvas.yview)
+            self._schedule_update()
+            return
+
+        if self.virtual_height is None:
+            self.vertical_scrollbar.config(command=self._virtual_yview)
+            self.canvas.yview_moveto(0)
+
+        self.virtual_height = height
+        self._set_virtual_top(self.virtual_top, notify=False)
+
+    def set_virtual_shift(self, shift: float):
+        """
+        Moves the interior up by shift pixels, for content which starts above the view in virtual coordinates
+        """
+
+        if shift != self._virtual_shift:
+            self._virtual_shift = shift
+            self.canvas.coords(self._interior_id, 0, -shift)
+
+    def _virtual_yview(self, *args):
+        if args[0] == MOVETO:
+            top = float(args[1]) * self.virtual_height
+        else:
+            step = VIRTUAL_SCROLL_UNIT
+            if args[2] == PAGES:
+                step = self._canvas_height * 0.9
+            top = self.virtual_top + int(args[1]) * step
+        self._set_virtual_top(top)
+
+    def _set_virtual_top(self, top: float, notify: bool = True):
+        """
+        Scrolls to logical pixel top in virtual coordinates, sets the scrollbar and calls the listeners
+        """
+
+        view_height = self._canvas_height
+        top = max(0, min(top, self.virtual_height - view_height))
+        changed = top != self.virtual_top
+        self.virtual_top = top
+
+        height = max(self.virtual_height, 1)
+        first = top / height
+        last = min(1.0, (top + view_height) / height)
+        self.vertical_scrollbar.set(first, last)
+
+        self._view = (first, last)
+        if notify or changed:
+            self._notify_view(first, last)
+
+    def scroll_to(self, y: float):
+        """
+        Scrolls so pixel y of the interior is at the top of the view, logical pixels in virtual coordinates
+        """
+
+        if self.virtual_height is None:
+            if self._interior_height > 0:
+                self.canvas.yview_moveto(y / self._interior_height)
+        else:
+            self._set_virtual_top(y, notify=False)
+
+    def scroll_to_end(self):
+        """
+        Scrolls to the bottom, also of content added just now which is not in the scroll region yet
+        """
+
+        if self.virtual_height is None:
+            self.canvas.yview_moveto(1.0)
+            self._scroll_to_end = True
+            self._schedule_update()
+        else:
+            self._set_virtual_top(self.virtual_height, notify=False)
+
+    def is_at_end(self):
+        """
+        Returns True if the bottom of the content is in view
+        """
+
+        return self._view[1] >= 1.0
+
+    def _scroll(self, number: int):
+        if self.virtual_height is None:
+            self.canvas.yview_scroll(number, UNITS)
+        else:
+            self._virtual_yview(SCROLL, number, UNITS)
+
+    def _on_yview(self, first, last):
+        if not self.virtual_height is None:  # the canvas itself does not scroll
+            return
+
+        self.vertical_scrollbar.set(first, last)
+
+        self._view = (float(first), float(last))
+        self._notify_view(float(first), float(last))
+
+    def _notify_view(self, first: float, last: float):
+        for callback in self.view_listeners:
+            callback(first, last)
+
+        self._schedule_visible_range()  # scrolling and resizing end up here
+        self._schedule_placeholders()
+
     def _on_scroll(self, event):
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), UNITS)
+        self._scroll(int(-1 * (event.delta / 120)))
 
     def _scroll_down(self, event):
-        self.canvas.yview_scroll(1, UNITS)
+        self._scroll(1)
 
     def _scroll_up(self, event):
-        self.canvas.yview_scroll(-1, UNITS)
+        self._scroll(-1)
+
+    def add_bindtag(self, widget):
+        """
+        Scrolls this frame with the mouse wheel over widget and its children
+        Children of the interior get it with the next scroll region update,
+        call it to scroll over widgets outside of the interior or right away
+        """
 
-    def _bind_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_scroll)
+        table = hasattr(widget, "add_cell_bindtag")
+        if not widget in self._tagged_widgets:
+            if table:  # a table tags its cells itself
+                widget.add_cell_bindtag(self.bindtag)
+            else:
+                tags = widget.bindtags()
+                if not self.bindtag in tags:
+                    widget.bindtags((tags[0], self.bindtag) + tags[1:])
+            self._tagged_widgets.add(widget)
 
-        # X11 compatibility
-        self.canvas.bind_all("<Button-4>", self._scroll_up)
-        self.canvas.bind_all("<Button-5>", self._scroll_down)
+        if not table:  # tagged widgets may have got new children
+            for child in widget.children.values():
+                self.add_bindtag(child)
 
-    def _unbind_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
 
-        # X11 compatibility
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+class _Placeholder:
+    """
+    Lazy child of a scrolled frame
+    """
+
+    def __init__(self, frame, height: int, factory, destroy_hidden: bool):
+        self.frame = frame
+        self.height = height  # estimated until filled
+        self.factory = factory
+        self.destroy_hidden = destroy_hidden
+        self.filled = False
+
+
+class _Frozen:
+    """
+    Context of a freeze, thaws the scrolled frame on exit
+    """
+
+    def __init__(self, scrolled_frame):
+        self.scrolled_frame = scrolled_frame
+
+    def __enter__(self):
+        return self.scrolled_frame
+
+    def __exit__(self, *args):
+        self.scrolled_frame.thaw()
 
 
 if __name__ == "__main__":
@@ -163,5 +541,15 @@ if __name__ == "__main__":
                 buttons.append(ttk.Button(self.frame.interior, text="Button " + str(i)))
                 buttons[-1].pack()
 
+            # sections below are only created when scrolled near
+            for i in range(1000):
+                self.frame.add_placeholder(
+                    40,
+                    lambda frame, i=i: ttk.Label(frame, text=f"Section {i}").pack(
+                        pady=10
+                    ),
+                    destroy_hidden=True,
+                )
+
     app = SampleApp()
     app.mainloop()
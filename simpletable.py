@@ -17,14 +17,22 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
+from itertools import chain
 import tkinter as tk
 from tkinter.constants import *
 from scrollframe import ScrolledFrame
+from celleditor import CellEditor
+from chunkedloader import ChunkedLoader
+from updatequeue import UpdateQueue
+from tailbuffer import TailBuffer, MAX_ROWS
 from table import (
     Table,
+    VirtualTable,
     get_title_row_generator,
     get_readonly_row_generator,
     get_input_row_generator_centered,
+    _chunk_rows_async,
 )
 
 __doc__ = """
@@ -40,14 +48,36 @@ COLOR_SELECTED = "deepskyblue"
 class SimpleTable(ScrolledFrame):
     """
     Simple scrollable table
+    A single editor renders virtually unless virtual is given, a table with a widget
+    for every cell would gain little from sharing the entry
     """
 
-    def __init__(self, parent, read_only: bool = True, mark_selected_row: bool = True):
+    def __init__(
+        self,
+        parent,
+        read_only: bool = True,
+        mark_selected_row: bool = True,
+        virtual: bool = None,
+        single_editor: bool = False,
+        virtual_coordinates: bool = True,
+    ):
         ScrolledFrame.__init__(self, parent)
 
-        self.table = Table(self.interior)
+        if virtual is None:
+            virtual = single_editor and not read_only
+        if virtual:  # only rows in view get widgets
+            self.table = VirtualTable(self.interior)
+            # only the view is laid out, pad rows for all rows pass the window size limit of tk
+            self.table.attach(self, virtual_coordinates=virtual_coordinates)
+        else:
+            self.table = Table(self.interior)
         self.table.pack()
 
+        # editable data rows are labels with one shared entry moved to the double clicked cell
+        self.cell_editor = None
+        if single_editor and not read_only:
+            self.cell_editor = CellEditor(self.table, first_row=1)
+
         self.table.add_row(get_title_row_generator(0))  # to mark the title row
 
         self.footer = tk.Frame(self.interior)
@@ -56,53 +86,108 @@ class SimpleTable(ScrolledFrame):
         self.new_button = tk.Button(self.footer, text="New", command=self._add_row)
         self.new_button.pack()
 
-        # dynamic bind right mouse to open menu
-        self.interior.bind("<Enter>", lambda event: self._bind_mouse_buttons())
-        self.interior.bind("<Leave>", lambda event: self._unbind_mouse_buttons())
+        # mouse buttons bound once on the tag of the table cells, scrolling over cells too
+        self.bind_class(self.table.bindtag, "<Button-3>", self._show_menu)
+        self.bind_class(self.table.bindtag, "<Button-1>", self._select_widget)
+        self.bind_class(self.table.bindtag, "<Control-Button-1>", self._toggle_widget)
+        self.bind_class(self.table.bindtag, "<Shift-Button-1>", self._extend_selection)
+        self.bind_class(self.table.bindtag, "<Double-Button-1>", self._edit_widget)
+        self.table.add_cell_bindtag(self.bindtag)
 
         self.read_only = read_only
         self.mark_selected_row = mark_selected_row
 
         self.new_row_generator = None
         self.insert_row_generator = None
+        self.insert_rows_generator = None
 
-        self.selected_widget = None
+        self.loader = None  # loads data rows in slices
+        # model row ids, the selection stays on its rows when rows move or get removed
+        self.selected_row_id = None  # last clicked row
+        self.selected_row_ids = []  # all selected rows
         self.right_click_menu = None
 
         self.color_unselected = COLOR_UNSELECTED
         self.color_selected = COLOR_SELECTED
 
-    def _bind_mouse_buttons(self):
-        self.canvas.bind_all("<Button-3>", self._show_menu)
-        self.canvas.bind_all("<Button-1>", self._select_widget)
+    def _edit_widget(self, event):
+        if self.cell_editor is None:
+            return
 
-    def _unbind_mouse_buttons(self):
-        self.canvas.unbind_all("<Button-3>")
-        self.canvas.unbind_all("<Button-1>")
+        row, column = self.table.cell_of(event.widget)
+        if row > 0:  # the title is not editable
+            self.cell_editor.edit(row, column)
 
     def _select_widget(self, event):
-        old_selected = self.selected_widget
+        if not self.cell_editor is None and event.widget is not self.cell_editor:
+            self.cell_editor.commit()  # labels take no focus, commit on click
+
+        selected_row = self.table.row_of(event.widget)
+        if selected_row > 0:  # ignore invalid selection and keep the old one
+            row_id = self.table.model.get_row_id(selected_row)
+            self._set_selection(row_id, [row_id])
+
+        self._close_menu()
+
+    def _toggle_widget(self, event):
+        selected_row = self.table.row_of(event.widget)
+        if selected_row > 0:
+            row_id = self.table.model.get_row_id(selected_row)
+            if row_id in self.selected_row_ids:
+                row_ids = [other for other in self.selected_row_ids if other != row_id]
+            else:
+                row_ids = self.selected_row_ids + [row_id]
+            self._set_selection(row_id, row_ids)
+
+        self._close_menu()
+
+    def _extend_selection(self, event):
+        selected_row = self.table.row_of(event.widget)
+        if selected_row > 0:
+            anchor = self.get_selected_row()
+            if anchor < 1:
+                anchor = selected_row
+            first, last = sorted((anchor, selected_row))
+            self._set_selection(
+                self.table.model.get_row_id(anchor),
+                [self.table.model.get_row_id(row) for row in range(first, last + 1)],
+            )
+
+        self._close_menu()
+
+    def _set_selection(self, selected_row_id, selected_row_ids):
         if self.mark_selected_row:
-            self._mark_selected_row(self.color_unselected)
-        self.selected_widget = event.widget
-        if self.get_selected_row() < 1:
-            self.selected_widget = old_selected  # new selection invalid, revert
+            self._mark_selected_rows(self.color_unselected)
+        self.selected_row_id = selected_row_id
+        self.selected_row_ids = selected_row_ids
         if self.mark_selected_row:
-            self._mark_selected_row(self.color_selected)
+            self._mark_selected_rows(self.color_selected)
 
+    def _close_menu(self):
         if not self.right_click_menu is None:
             self.right_click_menu.destroy()  # we have a menu open, close it
             self.right_click_menu = None
 
     def _show_menu(self, event):
-        self._select_widget(event)
+        if not self.table.row_of(event.widget) in self.get_selected_rows():
+            self._select_widget(event)  # keep a multi selection the user clicked into
+        self._close_menu()
 
         self.right_click_menu = tk.Menu(
             self.interior, tearoff=0
         )  # hide tearoff line to make subwindow
         self.right_click_menu.add_command(label="New", command=self._add_row)
 
-        if self.get_selected_row() > 0:  # only show delete if user selected valid row
+        selected_rows = self.get_selected_rows()
+        if len(selected_rows) > 1:
+            self.right_click_menu.add_command(
+                label=f"Insert {len(selected_rows)} rows before",
+                command=self._insert_row,
+            )
+            self.right_click_menu.add_command(
+                label=f"Delete {len(selected_rows)} rows", command=self._delete_row
+            )
+        elif selected_rows:  # only show delete if user selected valid row
             self.right_click_menu.add_command(
                 label="Insert before", command=self._insert_row
             )
@@ -123,31 +208,155 @@ class SimpleTable(ScrolledFrame):
 
     def set_data(self, data_rows):
         """
-        Generates read only rows for data rows
+        Generates rows for data rows after the existing rows
+        Use replace_data to refresh a table
+        """
+
+        row_generator = self._set_row_generators(len(data_rows[0]))
+        with self.freeze(), self.table.batch():  # laid out once
+            self.table.add_data_rows(data_rows, row_generator)  # created already filled
+
+    async def set_data_async(self, data_rows):
+        """
+        Generates rows for data rows of an async iterator or iterable after the existing rows,
+        added in chunks while the event loop keeps running. Returns number of added rows
+        """
+
+        self._cancel_loading()
+
+        row_generator = None
+        added = 0
+        async for chunk in _chunk_rows_async(data_rows):
+            if row_generator is None:  # columns known from the first row
+                row_generator = self._set_row_generators(len(chunk[0]))
+            with self.freeze(), self.table.batch():
+                self.table.add_data_rows(chunk, row_generator)
+            added += len(chunk)
+            await asyncio.sleep(0)
+        return added
+
+    def load_data(self, data_rows, on_progress=None, on_done=None):
+        """
+        Generates rows for data rows after the existing rows in slices of a few milliseconds,
+        the window stays responsive and the first screenful shows right away
+        on_progress is called with (loaded rows, total rows), on_done with the loaded rows
+        Data rows may be an iterator, the total is None then
+        Returns the loader, cancel it to stop loading
+        """
+
+        self._cancel_loading()
+
+        rows = iter(data_rows)
+        first_row = next(rows, None)
+        row_generator = None  # no rows, the loader only reports them done
+        if not first_row is None:
+            row_generator = self._set_row_generators(len(first_row))
+            if not hasattr(data_rows, "__len__"):  # the peeked row loads first
+                data_rows = chain([first_row], rows)
+
+        self.loader = ChunkedLoader(
+            self.table,
+            data_rows,
+            row_generator,
+            on_progress=on_progress,
+            on_done=on_done,
+        ).start()
+        return self.loader
+
+    def create_update_queue(self, columns: int, **kwargs):
+        """
+        Returns a started update queue of the table to post updates from worker threads
+        Upserts of new keys add data rows of columns cells, keyword arguments go to UpdateQueue
+        """
+
+        return UpdateQueue(
+            self.table, self._set_row_generators(columns), **kwargs
+        ).start()
+
+    def create_tail(self, columns: int, max_rows: int = MAX_ROWS, **kwargs):
+        """
+        Returns a tail buffer which keeps the last max rows of data rows with columns cells appended to it,
+        following them while scrolled to the end. Keyword arguments go to TailBuffer
+        """
+
+        return TailBuffer(
+            self.table,
+            self._set_row_generators(columns),
+            max_rows,
+            scrolled_frame=self,
+            first_row=1,  # below the title
+            **kwargs,
+        )
+
+    def _cancel_loading(self):
+        if not self.loader is None:
+            self.loader.cancel()
+            self.loader = None
+
+    def replace_data(self, data_rows):
+        """
+        Replaces all data rows, rows with the same number of columns keep their widgets
         """
 
-        columns = len(data_rows[0])
+        self._set_selection(
+            None, []
+        )  # rows get new data, unmark before they are reused
+        self.update_data(data_rows)
+
+    def update_data(self, data_rows):
+        """
+        Updates the data rows to data rows, only cells which changed are set
+        Rows are added or removed at the end, the selection stays
+        Returns number of cells set, created or removed
+        """
+
+        self._cancel_loading()  # rows still loading would land after the new data
+        if not data_rows:
+            touched = sum([len(values) for values in self.table.get_rows(1)])
+            self.clear()
+            return touched
+
+        row_generator = self._set_row_generators(len(data_rows[0]))
+        with self.freeze(), self.table.batch():
+            touched = self.table.update_data(data_rows, row_generator, row=1)
+        return touched
+
+    def clear(self):
+        """
+        Removes all data rows at once, the title stays
+        """
+
+        self._cancel_loading()
+        self._set_selection(None, [])
+        self.table.remove_rows(range(1, self.table.get_row_count()))
+
+    def _set_row_generators(self, columns: int):
+        """
+        Sets the generators used by the new button and context menu, returns the data row generator
+        """
+
+        # one generator for all data rows, rows of the same generator can share widgets
+        if self.read_only or not self.cell_editor is None:
+            row_generator = get_readonly_row_generator(columns)
+        else:
+            row_generator = get_input_row_generator_centered(columns)
 
         # we define the row generator here to share with the new button
         def _new_row_generator():
-            if self.read_only:
-                self.table.add_row(get_readonly_row_generator(columns))
-            else:
-                self.table.add_row(get_input_row_generator_centered(columns))
+            self.table.add_row(row_generator)
 
-        # also the insert row generator for the context menu
+        # also the insert row generators for the context menu
         def _insert_row_generator(row: int):
-            if self.read_only:
-                self.table.insert_row(row, get_readonly_row_generator(columns))
-            else:
-                self.table.insert_row(row, get_input_row_generator_centered(columns))
+            self.table.insert_row(row, row_generator)
+
+        def _insert_rows_generator(row: int, number_of_rows: int):
+            self.table.insert_rows(row, number_of_rows, row_generator)
 
         self.new_row_generator = _new_row_generator
         self.insert_row_generator = _insert_row_generator
+        self.insert_rows_generator = _insert_rows_generator
 
-        for row in data_rows:
-            self.new_row_generator()
-            self.table.set_row(self.table.get_row_count() - 1, row)
+        return row_generator
 
     def _add_row(self):
         if self.new_row_generator is None:
@@ -157,51 +366,66 @@ class SimpleTable(ScrolledFrame):
 
     def get_selected_row(self):
         """
-        Returns selected row number
+        Returns selected row number or -1
         """
 
-        if self.selected_widget is None:
-            return -1
+        return self._get_position(self.selected_row_id)
 
-        if ROW in self.selected_widget.grid_info():
-            return (
-                self.selected_widget.grid_info()[ROW] - 1
-            )  # need to subtract one to get the right row in the list
+    def get_selected_rows(self):
+        """
+        Returns all selected row numbers in order, rows removed meanwhile are left out
+        """
 
-        return -1  # row not found in grid info, user clicked on gap
+        rows = [self._get_position(row_id) for row_id in self.selected_row_ids]
+        return sorted([row for row in rows if row > 0])
+
+    def _get_position(self, row_id):
+        """
+        Returns current row of a selected row id, -1 for the title and removed rows
+        """
+
+        if row_id is None:
+            return -1
+
+        try:
+            row = self.table.model.get_position(row_id)
+        except KeyError:  # removed from outside, e.g. by a tail buffer
+            return -1
+        return row if row > 0 else -1
 
     def _delete_row(self):
-        selected_row = self.get_selected_row()
+        selected_rows = self.get_selected_rows()  # never contains the title
 
-        if selected_row < 1:  # prevent deletion of title
+        if not selected_rows:
             return
 
-        self.table.remove_row(selected_row)
+        self.table.remove_rows(selected_rows)  # all at once
 
-        self.selected_widget = None  # deselect now deleted widget
+        self.selected_row_id = None  # deselect now deleted rows
+        self.selected_row_ids = []
 
     def _insert_row(self):
         if self.new_row_generator is None:
             return
 
-        selected_row = self.get_selected_row()
+        selected_rows = self.get_selected_rows()
 
-        if selected_row < 1:  # prevent insertion before title
+        if not selected_rows:  # prevent insertion before title
             return
 
-        self.insert_row_generator(selected_row)
+        # insert as many rows as selected before the first selected row
+        number_of_rows = len(selected_rows)
+        if number_of_rows == 1:
+            self.insert_row_generator(selected_rows[0])
+        else:
+            self.insert_rows_generator(selected_rows[0], number_of_rows)
 
     def _mark_row(self, row: int, color):
-        for widget in self.table.widgets[row]:
-            widget.configure(bg=color)
+        self.table.configure_row(row, bg=color)
 
-    def _mark_selected_row(self, color):
-        selected_row = self.get_selected_row()
-
-        if selected_row < 1:  # prevent marking of title
-            return
-
-        self._mark_row(selected_row, color)
+    def _mark_selected_rows(self, color):
+        for row in self.get_selected_rows():  # skips rows removed from outside
+            self._mark_row(row, color)
 
     def get_selcted_row_data(self):
         """
@@ -226,9 +450,7 @@ class SimpleTable(ScrolledFrame):
             start_row = 1
 
         data = []
-        for row in range(start_row, self.table.get_row_count()):
-            row_data = self.table.get_row(row)
-
+        for row_data in self.table.get_rows(start_row):  # read from the model
             if skip_empty_rows:
                 is_empty = True
                 for cell in row_data:
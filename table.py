@@ -17,9 +17,14 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
+from time import perf_counter
 import tkinter as tk
 from tkinter import ttk
 from tkinter.constants import *
+from tablemodel import TableModel
+from rowheights import RowHeights
+from rowruns import RowRuns
 
 __doc__ = """
 Table base functionality
@@ -27,6 +32,15 @@ Table base functionality
 
 ROW = "row"
 
+VIRTUAL_VIEWPORT_HEIGHT = (
+    600  # pixels rendered by a virtual table until it knows its viewport
+)
+POOL_SIZE = 100  # removed widget rows a table keeps per kind of row
+GRID_ROWS = 10000  # grid rows tk allows in one grid, a table has at most one row less
+GRID_STEP = 8  # free grid rows left between appended rows for later inserts
+ASYNC_CHUNK_SIZE = 500  # rows added between two yields to the event loop
+ASYNC_FLUSH_TIME = 0.05  # seconds after which rows of a slow async source get shown
+
 
 def get_readonly_row_generator(columns: int, **kwargs):
     """
@@ -43,6 +57,10 @@ def get_readonly_row_generator(columns: int, **kwargs):
             widgets.append(label)
         return widgets
 
+    _generate_row.columns = columns
+    _generate_row.widget_class = tk.Label
+    _generate_row.options = kwargs
+    _generate_row.key = (tk.Label, columns, repr(sorted(kwargs.items())))
     return _generate_row
 
 
@@ -69,6 +87,10 @@ def get_input_row_generator(columns: int, **kwargs):
             widgets.append(label)
         return widgets
 
+    _generate_row.columns = columns
+    _generate_row.widget_class = tk.Entry
+    _generate_row.options = kwargs
+    _generate_row.key = (tk.Entry, columns, repr(sorted(kwargs.items())))
     return _generate_row
 
 
@@ -80,15 +102,360 @@ def get_input_row_generator_centered(columns: int, **kwargs):
     return get_input_row_generator(columns, justify="center", **kwargs)
 
 
+def _set_widget_value(widget, value):
+    if isinstance(widget, tk.Label):
+        widget.configure(text=value)
+    elif isinstance(widget, tk.Entry):
+        widget.delete(0, END)
+        widget.insert(0, value)
+
+
+def _set_path_value(parent, path: str, widget_class, value):
+    if widget_class is tk.Label:
+        parent.tk.call(path, "configure", "-text", value)
+    elif widget_class is tk.Entry:
+        parent.tk.call(path, "delete", 0, END)
+        parent.tk.call(path, "insert", 0, value)
+
+
+def _get_widget_value(widget):
+    if isinstance(widget, tk.Label):
+        return widget.cget("text")
+    if isinstance(widget, tk.Entry):
+        return widget.get()
+
+    return ""
+
+
+def _get_generator_key(row_generator):
+    """
+    Returns key shared by generators building the same kind of row
+    """
+
+    return getattr(row_generator, "key", row_generator)
+
+
+def _get_default_values(row_generator):
+    """
+    Returns values of a fresh row from generator options or None for unknown generators
+    """
+
+    options = getattr(row_generator, "options", None)
+    columns = getattr(row_generator, "columns", None)
+    if options is None or columns is None:
+        return None
+
+    if getattr(row_generator, "widget_class", None) is tk.Label:
+        return [options.get("text", "")] * columns
+    return [""] * columns
+
+
+def _get_initial_values(row_generator, widgets):
+    """
+    Returns values of freshly generated widgets, known from generator options if possible
+    """
+
+    defaults = _get_default_values(row_generator)
+    if defaults is None:  # unknown generator, ask the widgets once
+        return [_get_widget_value(widget) for widget in widgets]
+    return defaults
+
+
+def _fill_values(values, defaults):
+    """
+    Returns values cut or filled up with defaults to the length of defaults
+    """
+
+    values = list(values[: len(defaults)])
+    return values + defaults[len(values) :]
+
+
+def _destroy_widgets(parent, paths):
+    """
+    Destroys children of parent given by path with one tcl call and cleans up their python side
+    like destroy does, cells never wrapped in python only exist in tcl
+    """
+
+    if not paths:
+        return
+
+    for path in paths:
+        widget = parent.children.pop(path[path.rfind(".") + 1 :], None)
+        if not widget is None:
+            for child in list(widget.children.values()):
+                child.destroy()
+            tk.Misc.destroy(widget)  # removes registered python callbacks
+
+    parent.tk.call("destroy", *paths)
+
+
+def _get_paths(widgets):
+    """
+    Returns tcl path names of a row of widgets without wrapping script rows
+    """
+
+    paths = getattr(widgets, "paths", None)
+    if paths is None:
+        return [str(widget) for widget in widgets]
+    return list(paths)
+
+
+async def _chunk_rows_async(
+    data_rows, chunk_size: int = ASYNC_CHUNK_SIZE, flush_time: float = ASYNC_FLUSH_TIME
+):
+    """
+    Yields lists of rows from an async iterable or iterable, a chunk ends after chunk size rows
+    or flush time seconds after its first row, also while the source waits for the next row
+    """
+
+    if not hasattr(data_rows, "__aiter__"):  # no waiting, only slow rows
+        chunk = []
+        for values in data_rows:
+            if not chunk:
+                first_row = perf_counter()
+            chunk.append(values)
+            if len(chunk) >= chunk_size or perf_counter() - first_row >= flush_time:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+
+    rows = data_rows.__aiter__()
+    chunk = []
+    first_row = 0.0  # time the first row of the chunk arrived
+    next_row = None  # task waiting for the next row, it survives a flush
+    try:
+        while True:
+            if next_row is None:
+                next_row = asyncio.ensure_future(rows.__anext__())
+
+            timeout = None
+            if chunk:
+                timeout = max(0, flush_time - (perf_counter() - first_row))
+            done, _ = await asyncio.wait([next_row], timeout=timeout)
+            if not done:  # source waits, show the rows so far
+                yield chunk
+                chunk = []
+                continue
+
+            try:
+                values = next_row.result()
+            except StopAsyncIteration:
+                break
+            next_row = None
+
+            if not chunk:
+                first_row = perf_counter()
+            chunk.append(values)
+            if len(chunk) >= chunk_size or perf_counter() - first_row >= flush_time:
+                yield chunk
+                chunk = []
+    finally:
+        if not next_row is None:
+            next_row.cancel()
+    if chunk:
+        yield chunk
+
+
+def _get_pool_key(row_generator):
+    """
+    Returns key of the pool for rows of generator, None for rows which are not pooled
+    """
+
+    if _get_default_values(row_generator) is None:  # values of a reused row unknown
+        return None
+    if not getattr(row_generator, "widget_class", None) in _WIDGET_COMMANDS:
+        return None
+    return _get_generator_key(row_generator)
+
+
+def _is_row_of(widgets, widget_class):
+    """
+    Returns True if all widgets of the row are of widget class, without wrapping script rows
+    """
+
+    if isinstance(widgets, _ScriptRow):
+        return widgets.widget_class is widget_class
+    return all([type(widget) is widget_class for widget in widgets])
+
+
+# tk commands of the widgets script rows are built from
+_WIDGET_COMMANDS = {tk.Label: "label", tk.Entry: "entry"}
+
+# procedures defined once per interpreter, they take python tuples as tcl lists so values need no quoting
+_TCL_PROCEDURES = """
+proc tkinter_helpers_tag {paths tags} {
+    foreach path $paths {
+        bindtags $path [list $path {*}$tags {*}[lrange [bindtags $path] end-2 end]]
+    }
+}
+
+proc tkinter_helpers_configure_cells {paths option values} {
+    foreach path $paths value $values {
+        $path configure $option $value
+    }
+}
+
+proc tkinter_helpers_set_variables {names values} {
+    foreach name $names value $values {
+        set ::$name $value
+    }
+}
+
+proc tkinter_helpers_grid {rows grid_rows options} {
+    foreach paths $rows row $grid_rows {
+        set column 0
+        foreach path $paths {
+            if {[winfo manager $path] eq "grid"} {
+                grid configure $path -row $row
+            } else {
+                grid configure $path -row $row -column $column {*}$options
+            }
+            incr column
+        }
+    }
+}
+
+proc tkinter_helpers_create_cells {command parent counter option rows options tags} {
+    set paths {}
+    foreach values $rows {
+        foreach value $values {
+            set path $parent.!cell$counter
+            $command $path {*}$options $option $value
+            lappend paths $path
+            incr counter
+        }
+    }
+    tkinter_helpers_tag $paths $tags
+}
+"""
+
+
+class _ScriptRow:
+    """
+    Widgets of a row created by a tcl script, python objects are made when a cell is accessed
+    """
+
+    def __init__(self, parent, widget_class, paths):
+        self.parent = parent
+        self.widget_class = widget_class
+        self.paths = paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[column] for column in range(len(self.paths))[index]]
+
+        path = self.paths[index]
+        name = path[path.rfind(".") + 1 :]
+        widget = self.parent.children.get(name)
+        if widget is None:  # wrap the existing tcl widget without creating it again
+            widget = self.widget_class.__new__(self.widget_class)
+            widget.widgetName = _WIDGET_COMMANDS[self.widget_class]
+            widget._setup(self.parent, {"name": name})
+        return widget
+
+    def __iter__(self):
+        for column in range(len(self.paths)):
+            yield self[column]
+
+
 class Table(tk.Frame):
     """
     Simple table for data
+    Rows sit on sparse rows of one grid, inserting or removing a row only touches the widgets
+    of that row. A removed row leaves an empty grid row without height, neighbours get
+    spread out again once no grid row is left between them
     """
 
     def __init__(self, parent):
         tk.Frame.__init__(self, parent)
 
+        self.model = TableModel()  # values of all cells, read without tkinter
         self.widgets = []
+        self.cells = []  # per row the paths of its widgets
+        self._grid_rows = []  # per row its grid row, increasing with gaps
+
+        self.cell_editor = None  # shared editor placed over the edited cell
+
+        # data rows of labels and entries are created by one tcl call instead of per widget
+        self.create_with_script = True
+        self._cell_counter = 0  # names script created cells
+        if not self.tk.call("info", "commands", "tkinter_helpers_tag"):
+            self.tk.eval(_TCL_PROCEDURES)
+
+        # events of all cells reach bindings on these tags, no per widget or global binds
+        self.bindtag = f"Table{self}"
+        self._cell_bindtags = [self.bindtag]
+        self._tag_widgets([self])
+
+        # keyed by path, script rows wrap their widgets only when accessed
+        self._cell_of_widget = {}  # cell path -> (row id, column), rows renumber lazily
+        self._variables = (
+            {}
+        )  # entry path -> variable mirroring user input into the model
+        self._traces = {}  # entry path -> name of the trace on its variable
+        self._setting_variable = False
+
+        self._batched = 0  # number of open batches, placement waits for the last one
+        self._unplaced_cells = set()  # cells created in a batch, gridded when it ends
+        self._unplaced_from = 0  # rows above hold no unplaced cells
+
+        # removed rows are detached and reused by the next rows of the same kind
+        self.pool = {}  # generator key -> detached widget rows
+        self.pool_size = POOL_SIZE  # rows kept per kind of row, 0 turns pooling off
+        self.pool_hits = 0  # rows taken from the pool
+        self.pool_misses = 0  # rows created while the pool was empty
+        self._row_keys = []  # per row the pool key, None for rows not pooled
+        self._option_defaults = (
+            {}
+        )  # first cell path -> option values before configure_row
+
+    def batch(self):
+        """
+        Holds back placement of new cells and geometry propagation until the matching end_batch
+        Use as context manager for bulk structural edits, the layout is computed once at the end
+        """
+
+        if self._batched == 0:
+            self._set_propagate(False)
+        self._batched += 1
+        return _Batch(self)
+
+    def end_batch(self):
+        """
+        Ends a batch, cells get placed in one pass once all batches ended
+        """
+
+        if self._batched > 0:
+            self._batched -= 1
+        if self._batched == 0:
+            self._place_cells()
+            self._set_propagate(True)
+
+    def _set_propagate(self, propagate: bool):
+        self.grid_propagate(propagate)
+
+    def _place_cells(self):
+        """
+        Grids the cells created during a batch with one tcl call
+        """
+
+        if not self._unplaced_cells:
+            return
+
+        rows = [
+            row
+            for row in range(self._unplaced_from, len(self.cells))
+            if self.cells[row] and self.cells[row][0] in self._unplaced_cells
+        ]
+        self._grid_cells(
+            [self.cells[row] for row in rows], [self._grid_rows[row] for row in rows]
+        )
+        self._unplaced_cells.clear()
 
     def get_row_count(self):
         """
@@ -102,52 +469,325 @@ class Table(tk.Frame):
         Adds new row to table end from generator
         """
 
-        self.widgets.append(
-            row_generator(parent=self, row_position=self.get_row_count() + 1)
-        )
+        self.insert_row(self.get_row_count(), row_generator)
 
     def add_rows(self, number_of_rows: int, row_generator):
         """
         Adds a number of rows at the end of the table from generator
         """
 
-        for _ in range(number_of_rows):
-            self.add_row(row_generator)
+        self.insert_rows(self.get_row_count(), number_of_rows, row_generator)
+
+    def add_data_rows(self, data_rows, row_generator):
+        """
+        Adds rows already filled with data rows at the end of the table
+        """
+
+        self.insert_data_rows(self.get_row_count(), data_rows, row_generator)
+
+    async def add_data_rows_async(self, data_rows, row_generator):
+        """
+        Adds rows of an async iterator or iterable at the end of the table in chunks,
+        yields to the event loop after each chunk. Returns number of added rows
+        """
+
+        added = 0
+        async for chunk in _chunk_rows_async(data_rows):
+            with self.batch():
+                self.add_data_rows(chunk, row_generator)
+            added += len(chunk)
+            await asyncio.sleep(0)
+        return added
+
+    def insert_data_rows(self, row: int, data_rows, row_generator):
+        """
+        Inserts rows already filled with data rows onto the position
+        Widgets get created with their values and gridded with one call,
+        much faster than inserting empty rows and setting each cell
+        """
+
+        defaults = _get_default_values(row_generator)
+        widget_class = getattr(row_generator, "widget_class", None)
+        if defaults is None or not widget_class in (tk.Label, tk.Entry):
+            # unknown generator, fill the generated rows
+            data_rows = list(data_rows)
+            self.insert_rows(row, len(data_rows), row_generator)
+            for offset, values in enumerate(data_rows):
+                self.set_row(row + offset, values)
+            return
+
+        rows = [_fill_values(values, defaults) for values in data_rows]
+        grid_rows = self._allocate_grid_rows(row, len(rows))  # raises before any change
+        row_ids = self.model.insert_rows(row, rows)
+        new_rows = self._create_rows(rows, row_ids, row_generator)
+        self._place_rows(row, new_rows, _get_pool_key(row_generator), grid_rows)
+        self.widgets[row:row] = new_rows
+
+    def _create_rows(self, rows, row_ids, row_generator):
+        """
+        Returns label or entry rows showing rows of values, rows from the pool first
+        """
+
+        pooled = self.pool.get(_get_generator_key(row_generator), [])
+        reused = [pooled.pop() for _ in range(min(len(pooled), len(rows)))]
+        self.pool_hits += len(reused)
+        self.pool_misses += len(rows) - len(reused)
+        self._fill_rows(reused, rows, row_ids, row_generator.widget_class)
+
+        rows = rows[len(reused) :]
+        row_ids = row_ids[len(reused) :]
+        if self.create_with_script:
+            return reused + self._create_script_rows(rows, row_ids, row_generator)
+        return reused + self._create_python_rows(rows, row_ids, row_generator)
+
+    def _fill_rows(self, rows_of_widgets, rows, row_ids, widget_class):
+        """
+        Shows rows of values in reused widget rows with one tcl call
+        Entries keep their variables, their traces follow the cells to the new rows
+        """
+
+        paths = []
+        values = []
+        variables = []
+        for widgets, row_values, row_id in zip(rows_of_widgets, rows, row_ids):
+            row_paths = _get_paths(widgets)
+            if widget_class is tk.Entry:
+                for column, path in enumerate(row_paths):
+                    variables.append(str(self._variables[path]))
+            else:
+                paths += row_paths
+            values += row_values
+            self._index_cells(widgets, row_id)
+
+        if variables:  # values are in the model already
+            self._setting_variable = True
+            try:
+                self.tk.call(
+                    "tkinter_helpers_set_variables", tuple(variables), tuple(values)
+                )
+            finally:
+                self._setting_variable = False
+        elif paths:
+            self.tk.call(
+                "tkinter_helpers_configure_cells", tuple(paths), "-text", tuple(values)
+            )
+
+    def _create_python_rows(self, rows, row_ids, row_generator):
+        """
+        Creates label or entry rows showing rows of values widget by widget
+        """
+
+        widget_class = row_generator.widget_class
+        options = row_generator.options
+        new_rows = []
+        for values, row_id in zip(rows, row_ids):
+            if widget_class is tk.Label:
+                widgets = [tk.Label(self, options, text=value) for value in values]
+            else:
+                widgets = []
+                for column, value in enumerate(values):
+                    variable = tk.StringVar(self, value=value)
+                    widget = tk.Entry(self, options, textvariable=variable)
+                    self._trace_entry(widget, variable)
+                    widgets.append(widget)
+            self._index_cells(widgets, row_id)
+            new_rows.append(widgets)
+        return new_rows
+
+    def _create_script_rows(self, rows, row_ids, row_generator):
+        """
+        Creates label or entry rows showing rows of values with one tcl call
+        Returns the rows, their python widgets are made when accessed
+        """
+
+        widget_class = row_generator.widget_class
+        cell_rows = rows
+        option = "-text"
+        variables = None
+        if widget_class is tk.Entry:  # entries show variables mirrored into the model
+            variables = [
+                [tk.StringVar(self, value=value) for value in values] for values in rows
+            ]
+            cell_rows = [[str(variable) for variable in row] for row in variables]
+            option = "-textvariable"
+
+        counter = self._cell_counter
+        self._cell_counter += sum([len(values) for values in rows])
+        self.tk.call(
+            "tkinter_helpers_create_cells",
+            _WIDGET_COMMANDS[widget_class],
+            self._w,
+            counter,
+            option,
+            tuple([tuple(values) for values in cell_rows]),
+            self._options(row_generator.options),
+            tuple(self._cell_bindtags),
+        )
+
+        new_rows = []
+        for row, row_id in enumerate(row_ids):
+            paths = [
+                f"{self._w}.!cell{counter + column}" for column in range(len(rows[row]))
+            ]
+            counter += len(paths)
+
+            widgets = _ScriptRow(self, widget_class, paths)
+            if not variables is None:
+                for column, path in enumerate(paths):
+                    self._trace_entry(path, variables[row][column])
+            self._index_cells(widgets, row_id)
+            new_rows.append(widgets)
+        return new_rows
+
+    def update_data(self, data_rows, row_generator, row: int = 0):
+        """
+        Updates the rows from row on to data rows and only sets the cells which changed
+        Rows with the widgets the generator would build are kept, rows at the end are added or removed
+        Returns number of cells set, created or removed
+        """
+
+        data_rows = list(data_rows)
+        defaults = _get_default_values(row_generator)
+        widget_class = getattr(row_generator, "widget_class", None)
+
+        kept_rows = 0
+        if not defaults is None:
+            for widgets in self.widgets[row : row + len(data_rows)]:
+                if len(widgets) != len(defaults) or not _is_row_of(
+                    widgets, widget_class
+                ):
+                    break
+                kept_rows += 1
+
+        removed_rows = range(row + kept_rows, self.get_row_count())
+        touched = sum([len(self.widgets[removed]) for removed in removed_rows])
+        self.remove_rows(removed_rows)  # all at once
+
+        touched += self._update_rows(row, data_rows[:kept_rows], defaults)
+
+        self.insert_data_rows(row + kept_rows, data_rows[kept_rows:], row_generator)
+        touched += sum([len(widgets) for widgets in self.widgets[row + kept_rows :]])
+        return touched
+
+    def _update_rows(self, row: int, data_rows, defaults):
+        """
+        Sets the changed cells of rows, returns number of cells set
+        """
+
+        touched = 0
+        for offset, values in enumerate(data_rows):
+            old_values = self.model.get_row(row + offset)
+            for column, value in enumerate(_fill_values(values, defaults)):
+                if old_values[column] != value:
+                    self.set(row + offset, column, value)
+                    touched += 1
+        return touched
+
+    def set_key_column(self, column: int):
+        """
+        Indexes rows by their value in column for upsert, delete_keys and row_of_key
+        None removes the index
+        """
+
+        self.model.set_key_column(column)
+
+    def row_of_key(self, key):
+        """
+        Returns row with key in the key column or -1 if no row has the key
+        """
+
+        if not self.model.has_key(key):
+            return -1
+
+        return self.model.get_row_of_key(key)
+
+    def upsert(self, records, row_generator):
+        """
+        Updates the rows with the keys of records and adds records with new keys at the end
+        Rows are found through the key index, only changed cells are set
+        Returns number of cells set or created
+        """
+
+        key_column = self.model.key_column
+        if key_column is None:
+            raise ValueError("upsert needs a key column, call set_key_column first")
+
+        touched = 0
+        new_records = {}  # later records of the same new key replace earlier ones
+        for values in records:
+            key = values[key_column]
+            if key in new_records or not self.model.has_key(key):
+                new_records[key] = values
+                continue
+
+            row = self.model.get_row_of_key(key)
+            old_values = self.model.get_row(row)
+            for column, value in enumerate(values):
+                if column >= len(old_values) or old_values[column] != value:
+                    self.set(row, column, value)
+                    touched += 1
+
+        if new_records:
+            first_new_row = self.get_row_count()
+            self.add_data_rows(list(new_records.values()), row_generator)
+            touched += sum([len(values) for values in self.get_rows(first_new_row)])
+        return touched
+
+    def delete_keys(self, keys):
+        """
+        Deletes the rows with keys in the key column at once, unknown keys are ignored
+        Returns number of deleted rows
+        """
+
+        rows = {
+            self.model.get_row_of_key(key) for key in keys if self.model.has_key(key)
+        }
+        self.remove_rows(rows)
+        return len(rows)
 
     def set(self, row: int, column: int, value):
         """
         Sets cell on position row column to value
         """
 
-        widget = self.widgets[row][column]
-        if isinstance(widget, tk.Label):
-            widget.configure(text=value)
-        elif isinstance(widget, tk.Entry):
-            widget.delete(0, END)
-            widget.insert(0, value)
+        widgets = self.widgets[row]
+        if not -len(widgets) <= column < len(widgets):  # model rows may be wider
+            raise IndexError(f"row {row} has no column {column}")
+
+        if self.model.get(row, column) == value:  # widget shows it already
+            return
+
+        self.model.set(row, column, value)
+        if isinstance(widgets, _ScriptRow):  # set by path, no python widget gets made
+            self._set_value(widgets.paths[column], value, widgets.widget_class)
+        else:
+            self._set_value(widgets[column], value)
 
     def get(self, row: int, column: int):
         """
         Returns value from cell on position row column
         """
 
-        widget = self.widgets[row][column]
-        if isinstance(widget, tk.Label):
-            return widget.cget("text")
-        if isinstance(widget, tk.Entry):
-            return widget.get()
-
-        return ""
+        return self.model.get(row, column)
 
     def get_row(self, row: int):
         """
         Returns values as list for row
         """
 
-        values = []
-        for column in range(len(self.widgets[row])):
-            values.append(self.get(row, column))
-        return values
+        return self.model.get_row(row)[: len(self.widgets[row])]
+
+    def get_rows(self, start: int = 0, stop: int = None):
+        """
+        Returns values of rows from start to stop as list of lists
+        """
+
+        return [
+            values[: len(widgets)]
+            for values, widgets in zip(
+                self.model.get_rows(start, stop), self.widgets[start:stop]
+            )
+        ]
 
     def set_row(self, row: int, values):
         """
@@ -162,50 +802,1105 @@ class Table(tk.Frame):
         Deletes row and closes gap
         """
 
-        for column in range(len(self.widgets[row])):
-            self.widgets[row][column].destroy()
+        self.remove_rows([row])
+
+    def remove_rows(self, rows):
+        """
+        Deletes rows given as range or list of row numbers and closes the gaps at once
+        """
+
+        all_rows = range(self.get_row_count())
+        removed = {all_rows[row] for row in rows}
+        if not removed:
+            return
+
+        self._discard_rows(
+            [
+                (self.widgets[row], self.cells[row], self._row_keys[row])
+                for row in removed
+            ]
+        )  # empty grid rows take no space, the rows below keep their grid rows
+
+        first, last = min(removed), max(removed)
+        if self._unplaced_cells:  # unplaced rows below move up
+            self._unplaced_from = min(self._unplaced_from, first)
+        if last - first + 1 == len(removed):  # one block like the oldest rows of a tail
+            del self.cells[first : last + 1]
+            del self.widgets[first : last + 1]
+            del self._row_keys[first : last + 1]
+            del self._grid_rows[first : last + 1]
+        else:
+            self.cells = [
+                cells for row, cells in enumerate(self.cells) if row not in removed
+            ]
+            self.widgets = [
+                widgets
+                for row, widgets in enumerate(self.widgets)
+                if row not in removed
+            ]
+            self._row_keys = [
+                key for row, key in enumerate(self._row_keys) if row not in removed
+            ]
+            self._grid_rows = [
+                grid_row
+                for row, grid_row in enumerate(self._grid_rows)
+                if row not in removed
+            ]
+        self.model.remove_rows(removed)
+
+        if not self.cell_editor is None:  # edited row may be gone
+            self.cell_editor.follow()
+
+    def _discard_rows(self, removed):
+        """
+        Detaches widgets of removed rows into the pool or destroys them
+        Removed is a list of (widgets, cells, pool key)
+        """
+
+        detached = []
+        destroyed = []
+        for widgets, cells, key in removed:
+            self._forget_widgets(widgets)
+            self._unplaced_cells.difference_update(cells)
+            option_defaults = (
+                self._option_defaults.pop(cells[0], None) if cells else None
+            )
+
+            if self._pool_row(key, widgets, option_defaults):
+                detached += cells
+            else:
+                destroyed += cells
+
+        if detached:
+            self.tk.call("grid", "forget", *detached)
+        self._destroy_cells(destroyed)
+
+    def _pool_row(self, key, widgets, option_defaults):
+        """
+        Puts widgets of a row with its configured options restored into the pool
+        Returns False if the row is not pooled
+        """
+
+        if key is None:
+            return False
+
+        pooled = self.pool.setdefault(key, [])
+        if len(pooled) >= self.pool_size:
+            return False
+
+        if option_defaults:
+            for column, path in enumerate(_get_paths(widgets)):
+                for option, values in option_defaults.items():
+                    self.tk.call(path, "configure", f"-{option}", values[column])
+        pooled.append(widgets)
+        return True
+
+    def clear_pool(self):
+        """
+        Destroys the widget rows kept in the pool
+        """
+
+        paths = []
+        for pooled in self.pool.values():
+            for widgets in pooled:
+                paths += _get_paths(widgets)
+        self.pool = {}
+        self._destroy_cells(paths)
+
+    def destroy(self):
+        """
+        Destroys the table and frees the variables of its entries
+        """
+
+        variables = self._release_variables(list(self._variables))
+        tk.Frame.destroy(self)
+        self._unset_variables(variables)
+
+    def insert_row(self, row: int, row_generator):
+        """
+        Inserts a row onto the position
+        """
+
+        self.insert_rows(row, 1, row_generator)
+
+    def insert_rows(self, row: int, number_of_rows: int, row_generator):
+        """
+        Inserts a number of rows onto the position, gridded with one call
+        """
+
+        key = _get_pool_key(row_generator)
+        if not key is None and (self.create_with_script or self.pool.get(key)):
+            defaults = _get_default_values(row_generator)
+            self.insert_data_rows(row, [defaults] * number_of_rows, row_generator)
+            return
+
+        grid_rows = self._allocate_grid_rows(row, number_of_rows)
+        new_rows = [
+            row_generator(parent=self, row_position=grid_row) for grid_row in grid_rows
+        ]
+        self._place_rows(row, new_rows, key, grid_rows)
+        self.widgets[row:row] = new_rows
+        self._add_to_model(row, row_generator, new_rows)
+
+    def replace_row(self, row: int, row_generator):
+        """
+        Replaces row with another generated row
+        """
+
+        old_row = (self.widgets.pop(row), self.cells.pop(row), self._row_keys.pop(row))
+        grid_rows = [self._grid_rows.pop(row)]  # the new row takes the place
+        row_id = self.model.get_row_id(row)  # stays with the row
+
+        key = _get_pool_key(row_generator)
+        if key is None:
+            new_row = row_generator(parent=self, row_position=grid_rows[0])
+            values = _get_initial_values(row_generator, new_row)
+            self._index_cells(new_row, row_id)
+            self._watch_entries(new_row, values)
+        else:
+            values = _get_default_values(row_generator)
+            new_row = self._create_rows([values], [row_id], row_generator)[0]
+        self._place_rows(row, [new_row], key, grid_rows)
+        self.widgets.insert(row, new_row)
+
+        self._discard_rows([old_row])
+        self.model.set_row(
+            row, values + [""] * (self.model.get_column_count() - len(values))
+        )
+
+        if not self.cell_editor is None:  # edited cell has a new widget
+            self.cell_editor.follow()
+
+    def configure_row(self, row: int, **options):
+        """
+        Applies widget options like bg to all cells of row
+        """
+
+        paths = _get_paths(self.widgets[row])  # without wrapping script rows
+        if paths:  # remember the option values a pooled row gets back
+            option_defaults = self._option_defaults.setdefault(paths[0], {})
+            for option in options:
+                if not option in option_defaults:
+                    option_defaults[option] = [
+                        self.tk.call(path, "cget", f"-{option}") for path in paths
+                    ]
+
+        tcl_options = self._options(options)
+        for path in paths:
+            self.tk.call(path, "configure", *tcl_options)
+
+    def row_of(self, widget):
+        """
+        Returns row of a cell widget or -1 if widget is not a cell of this table
+        """
+
+        return self.cell_of(widget)[0]
+
+    def get_rows_between(self, top: float, bottom: float):
+        """
+        Returns (first_row, last_row) of the rows in the pixel range top to bottom of the table,
+        last_row is excluded. Rows are searched by position with a few tk queries
+        """
+
+        if not self.cells:
+            return (0, 0)
+
+        def _get_bbox(row):  # y and height of the grid row
+            return self.tk.splitlist(
+                self.tk.call("grid", "bbox", self._w, 0, self._grid_rows[row])
+            )
+
+        def _get_top(row):
+            return self.tk.getint(_get_bbox(row)[1])
+
+        def _get_bottom(row):
+            _, y, _, height = [self.tk.getint(value) for value in _get_bbox(row)]
+            return y + height
+
+        first_row = self._count_rows(lambda row: _get_bottom(row) <= top)
+        last_row = self._count_rows(lambda row: _get_top(row) < bottom)
+        return (first_row, max(first_row, last_row))
+
+    def _count_rows(self, predicate):
+        """
+        Returns number of leading rows matching predicate, rows after the first mismatch never match
+        """
+
+        low, high = 0, len(self.cells)
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(middle):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def cell_of(self, widget):
+        """
+        Returns (row, column) of a cell widget or (-1, -1) if widget is not a cell of this table
+        Rows are found by row id, after inserts and removes only the moved rows get renumbered
+        """
+
+        cell = self._cell_of_widget.get(
+            str(widget)
+        )  # events pass unwrapped cells as path
+        if cell is None:
+            return (-1, -1)
+
+        row_id, column = cell
+        return (self.model.get_position(row_id), column)
+
+    def get_cell_widget(self, row: int, column: int):
+        """
+        Returns widget showing cell on position row column or None
+        """
+
+        if 0 <= row < len(self.widgets) and 0 <= column < len(self.widgets[row]):
+            return self.widgets[row][column]
+        return None
+
+    def add_cell_bindtag(self, bindtag: str):
+        """
+        Attaches another bindtag to all cells, now and later, e.g. of the hosting scrolled frame
+        """
+
+        if bindtag in self._cell_bindtags:
+            return
+
+        self._cell_bindtags.append(bindtag)
+        self._tag_widgets(self._get_tagged_widgets())
+
+    def _get_tagged_widgets(self):
+        return [self] + [cell for cells in self.cells for cell in cells]
+
+    def _tag_widgets(self, widgets):
+        """
+        Puts the cell bindtags right after the own tag of each widget or path with one tcl call
+        """
+
+        self.tk.call(
+            "tkinter_helpers_tag",
+            tuple([str(widget) for widget in widgets]),
+            tuple(self._cell_bindtags),
+        )
+
+    def _add_to_model(self, row: int, row_generator, new_rows):
+        rows = [_get_initial_values(row_generator, widgets) for widgets in new_rows]
+        row_ids = self.model.insert_rows(row, rows)
+        for widgets, row_id, values in zip(new_rows, row_ids, rows):
+            self._index_cells(widgets, row_id)
+            self._watch_entries(widgets, values)
+
+    def _watch_entries(self, widgets, values):
+        """
+        Mirrors user input of entries into the model with a variable trace
+        """
+
+        for column, widget in enumerate(widgets):
+            if isinstance(widget, tk.Entry):
+                variable = tk.StringVar(self, value=values[column])
+                widget.configure(textvariable=variable)
+                self._trace_entry(widget, variable)
+
+    def _trace_entry(self, widget, variable):
+        """
+        Mirrors user input of an entry into the model row its cell currently shows
+        """
+
+        path = str(widget)
+        self._traces[path] = variable.trace_add(
+            "write", lambda *args: self._on_cell_write(path)
+        )
+        self._variables[path] = variable
+
+    def _release_variables(self, paths):
+        """
+        Removes the traces of the variables of entries, returns the names of the variables
+        Unset them once no entry shows them, an entry sets its variable again otherwise
+        """
+
+        names = []
+        for path in paths:
+            variable = self._variables.pop(path, None)
+            if variable is None:
+                continue
+
+            trace = self._traces.pop(path, None)
+            if not trace is None:  # deletes the command holding the variable
+                variable.trace_remove("write", trace)
+            names.append(str(variable))
+        return names
+
+    def _unset_variables(self, names):
+        if names:
+            self.tk.call("unset", "-nocomplain", *names)
+
+    def _destroy_cells(self, paths):
+        """
+        Destroys cells with one tcl call and frees the variables of their entries
+        """
+
+        variables = self._release_variables(paths)
+        _destroy_widgets(self, paths)
+        self._unset_variables(variables)
+
+    def _index_cells(self, widgets, row_id: int):
+        for column, path in enumerate(_get_paths(widgets)):
+            self._cell_of_widget[path] = (row_id, column)
+
+    def _forget_widgets(self, widgets):
+        for path in _get_paths(widgets):
+            self._cell_of_widget.pop(path, None)
+
+    def _on_cell_write(self, path: str):
+        cell = self._cell_of_widget.get(path)
+        if not cell is None:  # cells in the pool show no row
+            self._on_entry_write(*cell, self._variables[path])
+
+    def _on_entry_write(self, row_id: int, column: int, variable):
+        if self._setting_variable:  # value comes from set and is in the model already
+            return
+
+        try:
+            row = self.model.get_position(row_id)
+        except KeyError:  # row was removed
+            return
+        self.model.set(row, column, variable.get())
+
+    def _set_value(self, widget, value, widget_class=None):
+        """
+        Sets value of a cell widget, or of a cell path with the widget class of its script row
+        """
+
+        variable = self._variables.get(str(widget))
+        if variable is None:
+            if widget_class is None:
+                _set_widget_value(widget, value)
+            else:
+                _set_path_value(self, widget, widget_class, value)
+            return
+
+        self._setting_variable = True
+        try:
+            variable.set(value)
+        finally:
+            self._setting_variable = False
+
+    def _place_rows(self, row: int, new_rows, key=None, grid_rows=None):
+        """
+        Grids the widgets of new rows inserted at row between the grid rows of their neighbours
+        Key is the pool key of the rows, grid rows are allocated if not given
+        """
+
+        if grid_rows is None:
+            grid_rows = self._allocate_grid_rows(row, len(new_rows))
+
+        new_cells = []
+        untagged = []  # script rows come tagged already
+        for widgets in new_rows:
+            cells = _get_paths(widgets)
+            if not isinstance(widgets, _ScriptRow):
+                untagged += cells
+            new_cells.append(cells)
+        self._tag_widgets(untagged)
+
+        if self._batched > 0:  # placed when the batch ends
+            if not self._unplaced_cells:  # first new rows of the batch
+                self._unplaced_from = row
+            self._unplaced_from = min(self._unplaced_from, row)
+            for cells in new_cells:
+                self._unplaced_cells.update(cells)
+        else:
+            self._grid_cells(new_cells, grid_rows)
+
+        self.cells[row:row] = new_cells
+        self._row_keys[row:row] = [key] * len(new_cells)
+        self._grid_rows[row:row] = grid_rows
+
+    def _grid_cells(self, rows_of_cells, grid_rows):
+        """
+        Grids each row of cells on its grid row with one tcl call, cells gridded already only move
+        """
+
+        if rows_of_cells:
+            self.tk.call(
+                "tkinter_helpers_grid",
+                tuple([tuple(cells) for cells in rows_of_cells]),
+                tuple(grid_rows),
+                ("-sticky", NSEW, "-padx", 1, "-pady", 1),
+            )
+
+    def _allocate_grid_rows(self, row: int, number_of_rows: int):
+        """
+        Returns free grid rows for number of rows inserted at row, between the grid rows of
+        the rows before and after
+        """
+
+        low = 0  # grid row 0 stays free, rows start after it
+        if row > 0:
+            low = self._grid_rows[row - 1]
+
+        if row == len(self._grid_rows):  # appended with gaps like the rows before
+            free = GRID_ROWS - 1 - low
+            step = min(GRID_STEP, free // (2 * max(number_of_rows, 1)))
+            if row > 0:
+                step = min(step, low // row)
+            step = max(1, step)
+            if step * number_of_rows <= free:
+                return [low + step * (offset + 1) for offset in range(number_of_rows)]
+        else:
+            high = self._grid_rows[row]
+            if high - low > number_of_rows:
+                return [
+                    low + (high - low) * (offset + 1) // (number_of_rows + 1)
+                    for offset in range(number_of_rows)
+                ]
+        return self._spread_grid_rows(row, number_of_rows)
+
+    def _spread_grid_rows(self, row: int, number_of_rows: int):
+        """
+        Moves the rows around row further apart to make room for number of rows, the window
+        of moved rows doubles until it has enough free grid rows, small windows need more
+        Returns the grid rows of the new rows
+        """
+
+        count = len(self._grid_rows)
+        size = max(number_of_rows, 1)
+        if row == count:  # all rows, appends need room at the end
+            size = count
+        level = 0
+        while True:
+            first = max(0, row - size)
+            last = min(count, row + size)
+            low = self._grid_rows[first - 1] if first > 0 else 0
+            high = self._grid_rows[last] if last < count else GRID_ROWS
+            moved = last - first + number_of_rows
+            free = high - low - 1
+            if free >= moved + max(1, moved >> (level + 1)):
+                break
+            if first == 0 and last == count:
+                if free < moved:
+                    raise ValueError(
+                        f"a table holds at most {GRID_ROWS - 1} rows, use a virtual table"
+                    )
+                break
+            size *= 2
+            level += 1
+
+        if last == count:  # half of the free grid rows stay at the end for appends
+            high = low + 1 + moved + (free - moved) // 2
+        spread = [
+            low + (high - low) * (offset + 1) // (moved + 1) for offset in range(moved)
+        ]
+
+        # existing rows before row, the new rows, existing rows from row on
+        before = row - first
+        new_grid_rows = spread[before : before + number_of_rows]
+        old_grid_rows = spread[:before] + spread[before + number_of_rows :]
+        self._grid_rows[first:last] = old_grid_rows
+        self._grid_cells(self.cells[first:last], old_grid_rows)
+        return new_grid_rows
+
+
+class VirtualTable(Table):
+    """
+    Table which only creates widgets for the rows inside the viewport
+    Values stay in the model, a small pool of widget rows is rebound while scrolling
+    Attach to the ScrolledFrame hosting the table to follow its viewport
+    Rows may differ in height, offsets come from a prefix sum index of the row heights
+    """
+
+    def __init__(self, parent, row_height: int = None, overscan: int = 2):
+        Table.__init__(self, parent)
+
+        # height of all rows, measured per kind of row if None
+        self.row_height = row_height
+        self.overscan = overscan  # rows rendered above and below the viewport
+
+        self.generators = RowRuns()  # generator of each model row, stored per run
+        self.row_options = {}  # model row id -> options, only of configured rows
+        self.heights = RowHeights()  # per model row pixel height
+        self._key_heights = {}  # generator key -> measured height of its rows
+        self.slots = []  # rendered widget rows, slot i is gridded on grid row i + 1
+        self.pool = {}  # generator key -> unused widget rows
+        self.first_row = 0  # data row shown by the first slot
+
+        self.viewport = (0, VIRTUAL_VIEWPORT_HEIGHT)  # visible pixel range of the table
+        self.scrolled_frame = None
+        self.virtual_coordinates = False  # frame scrolls logical pixels, no pad rows
+
+        self._slot_of_widget = {}  # widget -> (slot position, column)
+        self._bottom_pad_row = 1
+        self._render_id = None
+
+    def attach(self, scrolled_frame, virtual_coordinates: bool = False):
+        """
+        Follows the viewport of the scrolled frame which hosts this table in its interior
+        With virtual coordinates the frame only lays out the rows in view, for any number of rows,
+        the table has to be the first content of the interior then. Without them pad rows take
+        the height of all rows, tk windows end at 32767 pixels which are about 1500 rows
+        """
+
+        self.scrolled_frame = scrolled_frame
+        self.virtual_coordinates = virtual_coordinates
+        scrolled_frame.add_view_listener(self._on_view_changed)
+        if virtual_coordinates:
+            scrolled_frame.set_virtual_height(0)
+            self._schedule_render()
+
+    def _on_view_changed(self, first: float, last: float):
+        if self.virtual_coordinates:
+            self.set_viewport(*self.scrolled_frame.get_visible_range())
+            return
+
+        interior = self.scrolled_frame.interior
+        height = interior.winfo_reqheight()
+        offset = (
+            self.winfo_rooty() - interior.winfo_rooty()
+        )  # table position in interior
+        self.set_viewport(first * height - offset, last * height - offset)
+
+    def set_viewport(self, top: float, bottom: float):
+        """
+        Sets visible pixel range relative to the table top and renders the rows in it
+        """
+
+        self.viewport = (top, bottom)
+        self._render()
+
+    def _schedule_render(self):
+        if self._render_id is None:
+            self._render_id = self.after_idle(self._render)
+
+    def _get_columns(self, row_generator):
+        columns = getattr(row_generator, "columns", None)
+        if columns is None:  # unknown generator, build one row and keep it for later
+            widgets = self._create_widgets(row_generator)
+            self.pool.setdefault(_get_generator_key(row_generator), []).append(widgets)
+            columns = len(widgets)
+            row_generator.columns = columns
+        return columns
+
+    def _get_defaults(self, row_generator):
+        self._get_columns(row_generator)
+        defaults = _get_default_values(row_generator)
+        if defaults is None:  # options unknown, values of a fresh row start empty
+            defaults = [""] * row_generator.columns
+        return defaults
+
+    def _insert_model_rows(self, row: int, number_of_rows: int, row_generator):
+        values = self._get_defaults(row_generator)
+        self.model.insert_rows(row, [values] * number_of_rows)
+        self.generators.insert_rows(row, number_of_rows, row_generator)
+        self._insert_heights(row, number_of_rows, row_generator)
+
+    def _insert_heights(self, row: int, number_of_rows: int, row_generator):
+        height = self._get_height_of(row_generator)
+        self.heights.insert_rows(row, [height] * number_of_rows)
+
+    def _get_height_of(self, row_generator):
+        """
+        Returns height of the rows of a generator, measured once on a pooled widget row
+        """
+
+        if not self.row_height is None:
+            return self.row_height
+
+        key = _get_generator_key(row_generator)
+        if key not in self._key_heights:
+            self.pool.setdefault(key, []).append(self._create_widgets(row_generator))
+        return self._key_heights[key]
+
+    def get_row_count(self):
+        """
+        Returns number of rows
+        """
+
+        return self.generators.get_row_count()
+
+    def add_row(self, row_generator):
+        """
+        Adds new row to table end from generator
+        """
+
+        self._insert_model_rows(self.get_row_count(), 1, row_generator)
+        self._schedule_render()
+
+    def set(self, row: int, column: int, value):
+        """
+        Sets cell on position row column to value
+        """
+
+        self.model.set(row, column, value)
+
+        slot = self._get_slot(row)
+        if not slot is None:
+            self._set_value(slot.widgets[column], value)
+            slot.values[column] = value
+
+    def insert_data_rows(self, row: int, data_rows, row_generator):
+        """
+        Inserts rows already filled with data rows onto the position
+        Only the model is filled, widgets follow for the rows in view
+        """
+
+        defaults = self._get_defaults(row_generator)
+        rows = [_fill_values(values, defaults) for values in data_rows]
+        self.model.insert_rows(row, rows)
+        self.generators.insert_rows(row, len(rows), row_generator)
+        self._insert_heights(row, len(rows), row_generator)
+        self._render()
+
+    def update_data(self, data_rows, row_generator, row: int = 0):
+        """
+        Updates the rows from row on to data rows and only sets the cells which changed
+        Rows of the same kind keep their options, rows at the end are added or removed
+        Returns number of cells set, created or removed in the model, widgets follow for the rows in view
+        """
+
+        data_rows = list(data_rows)
+        defaults = self._get_defaults(row_generator)
+        key = _get_generator_key(row_generator)
+
+        kept_rows = 0
+        for row_generator_kept in self.generators.get_values(row, row + len(data_rows)):
+            if _get_generator_key(row_generator_kept) != key:
+                break
+            kept_rows += 1
+
+        removed_rows = range(row + kept_rows, self.get_row_count())
+        touched = sum(
+            [
+                self._get_columns(row_generator_removed)
+                for row_generator_removed in self.generators.get_values(row + kept_rows)
+            ]
+        )
+        self._forget_options(removed_rows)
+        self.model.remove_rows(removed_rows)
+        self.heights.remove_rows(removed_rows)
+        self.generators.remove_rows(removed_rows)
+
+        touched += self._update_rows(row, data_rows[:kept_rows], defaults)
+
+        new_rows = [_fill_values(values, defaults) for values in data_rows[kept_rows:]]
+        self.model.insert_rows(row + kept_rows, new_rows)
+        self.generators.insert_rows(row + kept_rows, len(new_rows), row_generator)
+        self._insert_heights(row + kept_rows, len(new_rows), row_generator)
+        touched += len(new_rows) * len(defaults)
+
+        self._render()
+        return touched
+
+    def get_row(self, row: int):
+        """
+        Returns values as list for row
+        """
+
+        return self.model.get_row(row)[: self._get_columns(self.generators.get(row))]
+
+    def get_rows(self, start: int = 0, stop: int = None):
+        """
+        Returns values of rows from start to stop as list of lists
+        """
+
+        return [
+            values[: self._get_columns(row_generator)]
+            for values, row_generator in zip(
+                self.model.get_rows(start, stop),
+                self.generators.get_values(start, stop),
+            )
+        ]
+
+    def remove_row(self, row: int):
+        """
+        Deletes row and closes gap
+        """
+
+        self.remove_rows([row])
 
-        del self.widgets[row]
+    def remove_rows(self, rows):
+        """
+        Deletes rows given as range or list of row numbers and closes the gaps at once
+        """
 
-        for follow_up_row in range(row, self.get_row_count()):
-            for widget in self.widgets[
-                follow_up_row
-            ]:  # regrid all widgets to close gap in grid
-                widget_position = widget.grid_info()
-                widget_position[ROW] = (
-                    follow_up_row + 1
-                )  # remember tkinter grid begins at one
-                widget.grid_forget()
-                widget.grid(**widget_position)
+        all_rows = range(self.get_row_count())
+        removed = {all_rows[row] for row in rows}
+
+        self._forget_options(removed)
+        self.model.remove_rows(removed)
+        self.heights.remove_rows(removed)
+        self.generators.remove_rows(removed)
+        self._render()
 
     def insert_row(self, row: int, row_generator):
         """
         Inserts a row onto the position
         """
 
-        for follow_up_row in range(row, self.get_row_count()):
-            for widget in self.widgets[
-                follow_up_row
-            ]:  # regrid all widgets to close gap in grid
-                widget_position = widget.grid_info()
-                widget_position[ROW] = (
-                    follow_up_row + 2
-                )  # remember tkinter grid begins at one
-                widget.grid_forget()
-                widget.grid(**widget_position)
+        self.insert_rows(row, 1, row_generator)
+
+    def insert_rows(self, row: int, number_of_rows: int, row_generator):
+        """
+        Inserts a number of rows onto the position
+        """
 
-        new_row = row_generator(parent=self, row_position=row + 1)  # insert at grid pos
-        self.widgets.insert(row, new_row)  # insert in our table
+        self._insert_model_rows(row, number_of_rows, row_generator)
+        self._render()
 
     def replace_row(self, row: int, row_generator):
         """
         Replaces row with another generated row
         """
 
-        for column in range(len(self.widgets[row])):
-            self.widgets[row][column].destroy()
+        self._forget_options([row])
+        self.model.remove_rows([row])
+        self.heights.remove_rows([row])
+        self.generators.remove_rows([row])
+        self._insert_model_rows(row, 1, row_generator)
+        self._render()
+
+    def configure_row(self, row: int, **options):
+        """
+        Applies widget options like bg to all cells of row, options stay with the row while scrolling
+        """
+
+        row_options = self.row_options.setdefault(self.model.get_row_id(row), {})
+        row_options.update(options)
+
+        slot = self._get_slot(row)
+        if not slot is None:
+            self._apply_options(slot, row_options)
+
+    def _forget_options(self, rows):
+        if self.row_options:  # only configured rows have options
+            for row in rows:
+                self.row_options.pop(self.model.get_row_id(row), None)
+
+    def set_row_height(self, row: int, height: int):
+        """
+        Sets pixel height of row, rows below move down
+        """
+
+        self.heights.set_height(row, height)
+
+        slot = self._get_slot(row)
+        if not slot is None:
+            self.grid_rowconfigure(row - self.first_row + 1, minsize=height)
+            slot.height = height
+        self._schedule_render()  # pads and rows in view change
+
+    def get_row_height(self, row: int):
+        """
+        Returns pixel height of row
+        """
+
+        return self.heights.get_height(row)
+
+    def get_row_offset(self, row: int):
+        """
+        Returns pixel offset of the top of row from the table top
+        """
+
+        return self.heights.get_offset(row)
+
+    def row_at(self, y: float):
+        """
+        Returns row at pixel y of the table or -1 outside of the rows
+        """
+
+        if y < 0 or y >= self.heights.get_total_height():
+            return -1
+        return self.heights.row_at(y)
+
+    def scroll_to_row(self, row: int):
+        """
+        Scrolls the attached frame so row is at the top of the view
+        """
+
+        if self.scrolled_frame is None:
+            return
+
+        offset = self.heights.get_offset(row)
+        if not self.virtual_coordinates:  # table position in interior
+            offset += self.winfo_rooty() - self.scrolled_frame.interior.winfo_rooty()
+        self.scrolled_frame.scroll_to(offset)
+
+    def row_of(self, widget):
+        """
+        Returns row of a cell widget or -1 if widget is not a rendered cell of this table
+        """
+
+        return self.cell_of(widget)[0]
+
+    def get_rows_between(self, top: float, bottom: float):
+        """
+        Returns (first_row, last_row) of the rows in the pixel range top to bottom of the table,
+        last_row is excluded. Computed from the row heights in O(log n)
+        """
+
+        row_count = self.get_row_count()
+        first_row = self.heights.row_at(top)
+        last_row = self.heights.row_at(bottom)
+        if last_row < row_count and self.heights.get_offset(last_row) < bottom:
+            last_row += 1  # row reaches into the range
+        return (first_row, max(first_row, last_row))
+
+    def cell_of(self, widget):
+        """
+        Returns (row, column) of a cell widget or (-1, -1) if widget is not a rendered cell of this table
+        """
+
+        cell = self._slot_of_widget.get(widget)
+        if cell is None:
+            return (-1, -1)
+
+        slot_position, column = cell
+        return (self.first_row + slot_position, column)
+
+    def get_cell_widget(self, row: int, column: int):
+        """
+        Returns widget showing cell on position row column or None if the row is not rendered
+        """
+
+        slot = None
+        if 0 <= row < self.get_row_count():
+            slot = self._get_slot(row)
+        if slot is None or not 0 <= column < len(slot.widgets):
+            return None
+        return slot.widgets[column]
+
+    def _get_slot(self, row: int):
+        slot_position = row - self.first_row
+        if 0 <= slot_position < len(self.slots):
+            slot = self.slots[slot_position]
+            if slot.row_id == self.model.get_row_id(row):
+                return slot
+        return None
+
+    def _create_widgets(self, row_generator):
+        widgets = row_generator(parent=self, row_position=1)
+
+        key = _get_generator_key(row_generator)
+        if key not in self._key_heights:
+            self._key_heights[key] = (
+                max([widget.winfo_reqheight() for widget in widgets], default=0) + 2
+            )
+
+        for widget in widgets:
+            widget.grid_remove()
+        self._tag_widgets(widgets)
+        return widgets
+
+    def _get_tagged_widgets(self):
+        widgets = [self]
+        for slot in self.slots:
+            widgets += slot.widgets
+        for pooled in self.pool.values():
+            for pooled_widgets in pooled:
+                widgets += pooled_widgets
+        return widgets
+
+    def _take_widgets(self, row_generator):
+        pooled = self.pool.get(_get_generator_key(row_generator))
+        if pooled:
+            self.pool_hits += 1
+            return pooled.pop()
+        self.pool_misses += 1
+        return self._create_widgets(row_generator)
+
+    def _create_slot(self, row_generator):
+        slot = _VirtualSlot(row_generator, self._take_widgets(row_generator))
+
+        # entries write user input to the row the slot shows at that moment
+        for column, widget in enumerate(slot.widgets):
+            if isinstance(widget, tk.Entry):
+                variable = self._variables.get(str(widget))
+                if variable is None:
+                    variable = tk.StringVar(self)
+                    widget.configure(textvariable=variable)
+                    self._variables[str(widget)] = variable
+
+                trace = variable.trace_add(
+                    "write",
+                    lambda *args, variable=variable, column=column: self._on_slot_write(
+                        slot, column, variable
+                    ),
+                )
+                slot.traces.append((variable, trace))
+        return slot
+
+    def _on_slot_write(self, slot, column: int, variable):
+        if self._setting_variable:  # rendered value, the slot knows it already
+            return
+
+        # the entry shows the input now, a row with the old value has to be set again
+        slot.values[column] = variable.get()
+        self._on_entry_write(slot.row_id, column, variable)
+
+    def _release_slot(self, slot):
+        for widget in slot.widgets:
+            widget.grid_remove()
+            self._slot_of_widget.pop(widget, None)
+
+        for variable, trace in slot.traces:
+            variable.trace_remove("write", trace)
+        slot.traces = []
+
+        pooled = self.pool.setdefault(slot.key, [])
+        if len(pooled) >= self.pool_size:
+            self._destroy_cells(_get_paths(slot.widgets))
+            return
+
+        if slot.options:  # the next slot of these widgets starts without options
+            self._apply_options(slot, {})
+        pooled.append(slot.widgets)
+
+    def _apply_options(self, slot, options):
+        for key in set(slot.options) | set(options):
+            if key not in slot.defaults:
+                slot.defaults[key] = [widget.cget(key) for widget in slot.widgets]
+
+            if key in options:
+                if slot.options.get(key) != options[key]:
+                    for widget in slot.widgets:
+                        widget.configure({key: options[key]})
+            else:  # row has no own value, restore widget default
+                for widget, default in zip(slot.widgets, slot.defaults[key]):
+                    widget.configure({key: default})
+
+        slot.options = dict(options)
+
+    def end_batch(self):
+        """
+        Ends a batch, the rows in view get rendered once all batches ended
+        """
+
+        Table.end_batch(self)
+        if self._batched == 0:
+            self._render()
+
+    def _render(self):
+        if not self._render_id is None:
+            self.after_cancel(self._render_id)
+            self._render_id = None
+
+        if self._batched > 0:  # rendered when the batch ends
+            return
+
+        row_count = self.get_row_count()
+        rows_height = self.heights.get_total_height()
+
+        if self.virtual_coordinates:  # the height may have changed, the view with it
+            self._update_virtual_height(rows_height)
+            self.viewport = self.scrolled_frame.get_visible_range()
+
+        top, bottom = self.viewport
+        first_row, last_row = self.get_rows_between(top, bottom)
+        first_row = max(0, first_row - self.overscan)
+        last_row = min(row_count, max(first_row, last_row + self.overscan))
+        self.first_row = first_row
+
+        visible_values = self.model.get_rows(first_row, last_row)
+        visible_generators = self.generators.get_values(first_row, last_row)
+        for slot_position, row in enumerate(range(first_row, last_row)):
+            row_generator = visible_generators[slot_position]
+            row_id = self.model.get_row_id(row)
+            options = self.row_options.get(row_id, {})
+
+            slot = None
+            if slot_position < len(self.slots):
+                slot = self.slots[slot_position]
+
+            if slot is None or slot.key != _get_generator_key(row_generator):
+                if not slot is None:
+                    self._release_slot(slot)
+                slot = self._create_slot(row_generator)
+                if slot_position < len(self.slots):
+                    self.slots[slot_position] = slot
+                else:
+                    self.slots.append(slot)
+                for column, widget in enumerate(slot.widgets):
+                    widget.grid(row=slot_position + 1, column=column)
+                    self._slot_of_widget[widget] = (slot_position, column)
+
+            height = self.heights.get_height(row)
+            if slot.height != height:  # grid row keeps the height of the shown row
+                self.grid_rowconfigure(slot_position + 1, minsize=height)
+                slot.height = height
+
+            slot.row_id = row_id
+            for column, value in enumerate(visible_values[slot_position]):
+                if column < len(slot.values) and slot.values[column] != value:
+                    self._set_value(slot.widgets[column], value)
+                    slot.values[column] = value
+
+            if options or slot.options:
+                self._apply_options(slot, options)
+
+        slot_count = last_row - first_row
+        for slot_position in range(slot_count, len(self.slots)):
+            self._release_slot(self.slots[slot_position])
+            self.grid_rowconfigure(slot_position + 1, minsize=0)
+        del self.slots[slot_count:]
+
+        # empty grid rows with a minimum size stand in for the rows outside the viewport
+        top_pad = self.heights.get_offset(first_row)
+        bottom_pad = rows_height - self.heights.get_offset(last_row)
+        if self.virtual_coordinates:  # rows above the view are shifted out instead
+            self.scrolled_frame.set_virtual_shift(max(0, top - top_pad))
+            top_pad = bottom_pad = 0
+
+        self.grid_rowconfigure(0, minsize=top_pad)
+        if self._bottom_pad_row != slot_count + 1:
+            if self._bottom_pad_row > slot_count:  # old pad row is not a slot row now
+                self.grid_rowconfigure(self._bottom_pad_row, minsize=0)
+            self._bottom_pad_row = slot_count + 1
+        self.grid_rowconfigure(self._bottom_pad_row, minsize=bottom_pad)
+
+        if not self.cell_editor is None:  # slots show other rows now
+            self.cell_editor.follow()
+
+    def _update_virtual_height(self, rows_height: int):
+        """
+        Sets the logical height of the frame to all rows and the content below the table
+        """
+
+        rendered_height = sum([slot.height or 0 for slot in self.slots])
+        below = max(
+            0, self.scrolled_frame.interior.winfo_reqheight() - rendered_height
+        )  # like the footer of a simple table
+        self.scrolled_frame.set_virtual_height(rows_height + below)
+
+
+class _Batch:
+    """
+    Context of a batch, ends it on exit
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __enter__(self):
+        return self.table
+
+    def __exit__(self, *args):
+        self.table.end_batch()
+
+
+class _VirtualSlot:
+    """
+    Widget row rendered by a virtual table
+    """
 
-        self.widgets[row] = row_generator(parent=self, row_position=row + 1)
+    def __init__(self, row_generator, widgets):
+        self.key = _get_generator_key(row_generator)  # kind of row the widgets build
+        self.widgets = widgets
+        self.row_id = None  # model row currently shown
+        self.values = [None] * len(widgets)  # values currently shown
+        self.options = {}  # row options currently applied
+        self.defaults = {}  # widget option values before any row option was applied
+        self.traces = []  # entry traces writing into the shown row
+        self.height = None  # minimum size of the grid row
 
 
 if __name__ == "__main__":
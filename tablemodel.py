@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+
+__doc__ = """
+Table data kept in python, tables are views of a model
+"""
+
+
+class TableModel:
+    """
+    Column wise table data with a stable id for every row
+    Reading, filtering and exporting never needs tkinter
+    """
+
+    def __init__(self, number_of_columns: int = 0, key_column: int = None):
+        self.columns = [[] for _ in range(number_of_columns)]
+        self.row_ids = []
+        self.key_column = None
+
+        self._row_ids_by_key = {}  # value of the key column -> row id
+
+        self._next_row_id = 0
+        self._positions = {}  # row id -> row, trusted below _valid_positions
+        self._valid_positions = 0
+
+        if not key_column is None:
+            self.set_key_column(key_column)
+
+    def get_row_count(self):
+        """
+        Returns number of rows
+        """
+
+        return len(self.row_ids)
+
+    def get_column_count(self):
+        """
+        Returns number of columns
+        """
+
+        return len(self.columns)
+
+    def get(self, row: int, column: int):
+        """
+        Returns value from cell on position row column
+        """
+
+        return self.columns[column][row]
+
+    def set(self, row: int, column: int, value):
+        """
+        Sets cell on position row column to value
+        """
+
+        self._add_columns(column + 1)
+        if column == self.key_column:
+            self._unindex_row(row)
+            self.columns[column][row] = value
+            self._index_row(row)
+            return
+
+        self.columns[column][row] = value
+
+    def get_row(self, row: int):
+        """
+        Returns values as list for row
+        """
+
+        return [column[row] for column in self.columns]
+
+    def set_row(self, row: int, values):
+        """
+        Sets cells on row
+        """
+
+        self._add_columns(len(values))
+        self._unindex_row(row)
+        for column, value in zip(self.columns, values):
+            column[row] = value
+        self._index_row(row)
+
+    def get_rows(self, start: int = 0, stop: int = None):
+        """
+        Returns values of rows from start to stop as list of lists
+        """
+
+        if not self.columns:
+            return [[] for _ in self.row_ids[start:stop]]
+
+        return [
+            list(values)
+            for values in zip(*[column[start:stop] for column in self.columns])
+        ]
+
+    def get_column(self, column: int):
+        """
+        Returns values of column as list
+        """
+
+        return list(self.columns[column])
+
+    def insert_rows(self, row: int, rows):
+        """
+        Inserts rows of values onto the position, missing values are empty
+        Returns ids of the new rows
+        """
+
+        rows = list(rows)
+        self._add_columns(max([len(values) for values in rows], default=0))
+
+        for column_position, column in enumerate(self.columns):
+            column[row:row] = [
+                values[column_position] if column_position < len(values) else ""
+                for values in rows
+            ]
+
+        row_ids = list(range(self._next_row_id, self._next_row_id + len(rows)))
+        self._next_row_id += len(rows)
+        self.row_ids[row:row] = row_ids
+
+        if row < len(self.row_ids) - len(rows):  # following rows moved
+            self._valid_positions = min(self._valid_positions, row)
+
+        for new_row in range(row, row + len(rows)):
+            self._index_row(new_row)
+        return row_ids
+
+    def append_rows(self, rows):
+        """
+        Adds rows of values to the end
+        Returns ids of the new rows
+        """
+
+        return self.insert_rows(len(self.row_ids), rows)
+
+    def remove_rows(self, rows):
+        """
+        Deletes rows given as range or list of row numbers
+        """
+
+        all_rows = range(len(self.row_ids))
+        removed = {all_rows[row] for row in rows}
+        if not removed:
+            return
+
+        for row in removed:
+            self._unindex_row(row)
+            self._positions.pop(self.row_ids[row], None)
+
+        first, last = min(removed), max(removed)
+        if last - first + 1 == len(removed):  # one block, e.g. a single row
+            for column in self.columns:
+                del column[first : last + 1]
+            del self.row_ids[first : last + 1]
+        else:
+            self.columns = [
+                [value for row, value in enumerate(column) if row not in removed]
+                for column in self.columns
+            ]
+            self.row_ids = [
+                row_id for row, row_id in enumerate(self.row_ids) if row not in removed
+            ]
+
+        self._valid_positions = min(self._valid_positions, first)
+
+    def get_row_id(self, row: int):
+        """
+        Returns the stable id of the row on position row
+        """
+
+        return self.row_ids[row]
+
+    def get_position(self, row_id: int):
+        """
+        Returns current row of a row id, raises KeyError for removed rows
+        Only the rows after the first changed position get renumbered
+        """
+
+        row = self._positions.get(row_id)
+        if not row is None and row < self._valid_positions:
+            return row
+
+        for row in range(self._valid_positions, len(self.row_ids)):
+            self._positions[self.row_ids[row]] = row
+        self._valid_positions = len(self.row_ids)
+
+        return self._positions[row_id]
+
+    def set_key_column(self, column: int):
+        """
+        Indexes rows by the values of column, keys should be unique
+        None removes the index
+        """
+
+        self.key_column = column
+        self._row_ids_by_key = {}
+        if column is None:
+            return
+
+        self._add_columns(column + 1)
+        for key, row_id in zip(self.columns[column], self.row_ids):
+            self._row_ids_by_key[key] = row_id
+
+    def has_key(self, key):
+        """
+        Returns True if a row has key in the key column
+        """
+
+        return key in self._row_ids_by_key
+
+    def get_row_of_key(self, key):
+        """
+        Returns current row with key in the key column, raises KeyError for unknown keys
+        """
+
+        return self.get_position(self._row_ids_by_key[key])
+
+    def filter_rows(self, predicate, start: int = 0):
+        """
+        Returns rows from start on whose values as tuple match predicate
+        """
+
+        if not self.columns:
+            return []
+
+        columns = [column[start:] for column in self.columns]
+        return [
+            start + offset
+            for offset, values in enumerate(zip(*columns))
+            if predicate(values)
+        ]
+
+    def write_csv(self, file, start: int = 0):
+        """
+        Writes rows from start on to an open file as csv
+        """
+
+        writer = csv.writer(file)
+        writer.writerows(zip(*[column[start:] for column in self.columns]))
+
+    def _index_row(self, row: int):
+        if not self.key_column is None:
+            key = self.columns[self.key_column][row]
+            self._row_ids_by_key[key] = self.row_ids[row]
+
+    def _unindex_row(self, row: int):
+        if not self.key_column is None:
+            key = self.columns[self.key_column][row]
+            if self._row_ids_by_key.get(key) == self.row_ids[row]:
+                del self._row_ids_by_key[key]
+
+    def _add_columns(self, number_of_columns: int):
+        while len(self.columns) < number_of_columns:
+            self.columns.append([""] * len(self.row_ids))
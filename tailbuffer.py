@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter
+import tkinter as tk
+from tkinter.constants import *
+from scrollframe import ScrolledFrame
+from table import Table, get_readonly_row_generator
+
+__doc__ = """
+Bounded tail of a table for logs and live events, the oldest rows make room for new ones
+"""
+
+MAX_ROWS = 1000  # rows kept in the table
+MAX_RATE = 20  # flushes per second at most, rows appended in between show together
+
+
+class TailBuffer:
+    """
+    Keeps the last max rows appended to a table like a ring buffer, evicted rows give their widgets
+    to the new rows. Appends wait in a buffer and show at most max rate times a second,
+    an append costs O(1) and a flush the same however long the stream runs
+    Use from the tk thread, worker threads post through an UpdateQueue or after
+    """
+
+    def __init__(
+        self,
+        table,
+        row_generator,
+        max_rows: int = MAX_ROWS,
+        scrolled_frame=None,
+        auto_scroll: bool = True,
+        max_rate: float = MAX_RATE,
+        first_row: int = 0,
+    ):
+        self.table = table
+        self.row_generator = row_generator
+        self.max_rows = max_rows
+        self.scrolled_frame = scrolled_frame  # frame the table scrolls in
+        self.auto_scroll = auto_scroll  # follows new rows while scrolled to the end
+        self.interval = 1000 / max_rate  # milliseconds between two flushes at least
+        self.first_row = first_row  # rows above, like a title, are not part of the tail
+
+        self.appended = 0  # rows appended
+        self.evicted = 0  # rows removed from the table or dropped before they showed
+
+        self._pending = deque(maxlen=max_rows)  # only the newest rows can show
+        self._last_flush = 0.0
+        self._after_id = None
+
+    def append(self, values):
+        """
+        Appends a data row, shown with the next flush
+        """
+
+        self.appended += 1
+        if len(self._pending) == self._pending.maxlen:  # never shows
+            self.evicted += 1
+        self._pending.append(values)
+
+        if self._after_id is None:
+            wait = self.interval - (perf_counter() - self._last_flush) * 1000
+            self._after_id = self.table.after(max(int(wait), 1), self.flush)
+
+    def extend(self, data_rows):
+        """
+        Appends data rows, shown with the next flush
+        """
+
+        for values in data_rows:
+            self.append(values)
+
+    def get_pending_count(self):
+        """
+        Returns number of rows waiting for the next flush
+        """
+
+        return len(self._pending)
+
+    def stop(self):
+        """
+        Cancels the next flush, pending rows show with the next append or flush
+        """
+
+        if not self._after_id is None:
+            self.table.after_cancel(self._after_id)
+            self._after_id = None
+
+    def clear(self):
+        """
+        Removes the rows of the tail and the pending rows
+        """
+
+        self.stop()
+        self._pending.clear()
+        self.table.remove_rows(range(self.first_row, self.table.get_row_count()))
+
+    def flush(self):
+        """
+        Shows the pending rows now and evicts the oldest rows beyond max rows, returns number of shown rows
+        """
+
+        self.stop()
+        self._last_flush = perf_counter()
+        if not self._pending:
+            return 0
+
+        data_rows = list(self._pending)
+        self._pending.clear()
+
+        follow = (
+            self.auto_scroll
+            and not self.scrolled_frame is None
+            and self.scrolled_frame.is_at_end()
+        )
+
+        freeze = nullcontext()
+        if not self.scrolled_frame is None:
+            freeze = self.scrolled_frame.freeze()
+
+        with freeze, self.table.batch():  # laid out once per flush
+            rows = self.table.get_row_count() - self.first_row
+            evict = max(0, rows + len(data_rows) - self.max_rows)
+            if evict > len(data_rows):  # max rows got lowered
+                self._evict(evict - len(data_rows))
+                evict = len(data_rows)
+
+            # evicted rows go to the pool and come back as new rows, a pool full at a time
+            step = self.table.pool_size or len(data_rows)
+            for start in range(0, len(data_rows), step):
+                chunk = data_rows[start : start + step]
+                self._evict(min(evict, len(chunk)))
+                evict -= min(evict, len(chunk))
+                self.table.add_data_rows(chunk, self.row_generator)
+
+        if follow:
+            self.scrolled_frame.scroll_to_end()
+        return len(data_rows)
+
+    def _evict(self, number_of_rows: int):
+        if number_of_rows > 0:  # one block, removed by slicing
+            self.table.remove_rows(
+                range(self.first_row, self.first_row + number_of_rows)
+            )
+            self.evicted += number_of_rows
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate a live log with a bounded tail
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.frame = ScrolledFrame(self)
+            self.frame.pack(fill=BOTH, expand=TRUE)
+
+            self.table = Table(self.frame.interior)
+            self.table.pack()
+
+            self.tail = TailBuffer(
+                self.table,
+                get_readonly_row_generator(2),
+                max_rows=200,
+                scrolled_frame=self.frame,
+            )
+            self.line = 0
+            self._log()
+
+        def _log(self):
+            for _ in range(50):
+                self.line += 1
+                self.tail.append([f"{self.line}", f"event {self.line * 7 % 13}"])
+            self.after(5, self._log)
+
+    app = SampleApp()
+    app.mainloop()
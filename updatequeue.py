@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+#
+# tkinter-helpers: enhance your tkinter expirience
+# Copyright (C) 2023 Rafael Stauffer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import threading
+import time
+import random
+import tkinter as tk
+from tkinter.constants import *
+from table import Table, get_readonly_row_generator
+
+__doc__ = """
+Thread safe queue of table updates, applied by the tk thread in bounded batches
+"""
+
+DRAIN_INTERVAL = 20  # milliseconds between two drains of the queue
+BATCH_SIZE = 2000  # updates applied per drain, the rest waits for the next one
+
+CELL = "cell"
+KEY = "key"
+
+
+class UpdateQueue:
+    """
+    Takes cell, row and upsert updates from any thread, the tk thread applies them every drain interval
+    A cell written again before it was applied is applied once with the last value at the place
+    of the first write, the same goes for upserts of the same key
+    """
+
+    def __init__(
+        self,
+        table,
+        row_generator=None,
+        interval: int = DRAIN_INTERVAL,
+        batch_size: int = BATCH_SIZE,
+    ):
+        self.table = table
+        self.row_generator = row_generator  # builds rows of upserted new keys
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self.posted = 0  # updates posted
+        self.applied = 0  # updates applied to the table
+        self.collapsed = 0  # updates replaced by a later one before they were applied
+        self.failed = 0  # updates the table rejected, e.g. a cell beyond its row
+        self.last_error = None  # exception of the last failed update
+
+        # (CELL, row, column) or (KEY, key) -> value or record, in the order to apply them
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._after_id = None
+
+    def post_cell(self, row: int, column: int, value):
+        """
+        Posts value for cell on position row column, callable from any thread
+        """
+
+        with self._lock:
+            self._post((CELL, row, column), value)
+
+    def post_row(self, row: int, values):
+        """
+        Posts values for the cells of row, callable from any thread
+        """
+
+        with self._lock:
+            for column, value in enumerate(values):
+                self._post((CELL, row, column), value)
+
+    def post_upsert(self, record):
+        """
+        Posts a record for upsert by the key column of the table, callable from any thread
+        Needs the row generator, records of new keys become rows
+        """
+
+        if self.row_generator is None:
+            raise ValueError("upserts need a row generator for the rows of new keys")
+
+        with self._lock:
+            self._post((KEY, record[self.table.model.key_column]), list(record))
+
+    def _post(self, target, value):
+        self.posted += 1
+        if target in self._pending:  # keeps its place, a busy cell is not put back
+            self.collapsed += 1
+        self._pending[target] = value
+
+    def get_pending_count(self):
+        """
+        Returns number of updates waiting to be applied
+        """
+
+        with self._lock:
+            return len(self._pending)
+
+    def start(self):
+        """
+        Starts draining the queue in the tk thread, returns the queue
+        """
+
+        if self._after_id is None:
+            self._after_id = self.table.after(self.interval, self._drain)
+        return self
+
+    def stop(self):
+        """
+        Stops draining, pending updates stay in the queue
+        """
+
+        if not self._after_id is None:
+            self.table.after_cancel(self._after_id)
+            self._after_id = None
+
+    def drain(self):
+        """
+        Applies up to batch size pending updates in the tk thread, returns number applied
+        Updates the table rejects are dropped and counted as failed
+        """
+
+        with self._lock:
+            updates = []
+            for target in self._pending:
+                if len(updates) >= self.batch_size:
+                    break
+                updates.append(target)
+            updates = [(target, self._pending.pop(target)) for target in updates]
+
+        if not updates:
+            return 0
+
+        with self.table.batch():  # new rows of upserts are laid out once
+            records = []
+            for target, value in updates:
+                if target[0] == KEY:
+                    records.append(value)  # applied together with the following upserts
+                    continue
+
+                if records:
+                    self._upsert(records)
+                    records = []
+                self._set(target[1], target[2], value)
+            if records:
+                self._upsert(records)
+
+        self.applied += len(updates)
+        return len(updates)
+
+    def _upsert(self, records):
+        try:
+            self.table.upsert(records, self.row_generator)
+        except (
+            Exception
+        ):  # find the failing records, upserting a record again changes nothing
+            for record in records:
+                try:
+                    self.table.upsert([record], self.row_generator)
+                except Exception as error:
+                    self._fail(error)
+
+    def _set(self, row: int, column: int, value):
+        try:
+            if not 0 <= row < self.table.get_row_count() or column < 0:
+                raise IndexError(f"no cell at row {row} column {column}")
+            self.table.set(row, column, value)
+        except Exception as error:  # e.g. row has fewer columns
+            self._fail(error)
+
+    def _fail(self, error):
+        self.failed += 1
+        self.last_error = error
+
+    def _drain(self):
+        self._after_id = None
+        try:
+            self.drain()
+        finally:  # keeps draining after an error, tk reports it
+            self._after_id = self.table.after(self.interval, self._drain)
+
+
+if __name__ == "__main__":
+
+    class SampleApp(tk.Tk):
+        """
+        Sample tkinter app to demonstrate feeding a table from worker threads
+        """
+
+        def __init__(self, *args, **kwargs):
+            tk.Tk.__init__(self, *args, **kwargs)
+
+            self.table = Table(self)
+            self.table.add_data_rows(
+                [[f"{row}", "0"] for row in range(20)], get_readonly_row_generator(2)
+            )
+            self.table.pack()
+
+            self.queue = UpdateQueue(self.table).start()
+
+            for _ in range(4):
+                threading.Thread(target=self._feed, daemon=True).start()
+
+        def _feed(self):
+            while True:
+                self.queue.post_cell(random.randrange(20), 1, f"{random.random():.4f}")
+                time.sleep(0.0001)
+
+    app = SampleApp()
+    app.mainloop()